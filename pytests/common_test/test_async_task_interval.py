@@ -0,0 +1,31 @@
+"""测试异步任务的动态运行间隔。"""
+
+from typing import List
+
+import asyncio
+import pytest
+
+from src.manager.async_task_manager import AsyncTask
+
+
+class DynamicIntervalTask(AsyncTask):
+    def __init__(self, intervals: List[float]) -> None:
+        super().__init__(task_name="Dynamic Interval Task", run_interval=60)
+        self.intervals = intervals
+        self.run_count = 0
+
+    def get_run_interval(self) -> float:
+        return self.intervals.pop(0)
+
+    async def run(self) -> None:
+        self.run_count += 1
+
+
+@pytest.mark.asyncio
+async def test_start_task_uses_interval_computed_after_each_run() -> None:
+    task = DynamicIntervalTask([0.01, 0.01, 0])
+
+    await asyncio.wait_for(task.start_task(asyncio.Event()), timeout=1)
+
+    assert task.run_count == 3
+    assert task.intervals == []
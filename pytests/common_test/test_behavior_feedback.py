@@ -7,7 +7,8 @@ from sqlmodel import Session, SQLModel, create_engine
 import pytest
 
 import src.learners.behavior_pattern_store as pattern_store
-from src.common.database.database_model import BehaviorExperiencePath
+import src.learners.behavior_scene_cluster_store as scene_cluster_store
+from src.common.database.database_model import BehaviorExperiencePath, BehaviorSceneCluster
 from src.learners.behavior_learner import (
     BehaviorFeedbackContext,
     BehaviorFeedbackContextItem,
@@ -37,6 +38,7 @@ def _patch_pattern_store_session(monkeypatch: pytest.MonkeyPatch, engine) -> Non
                 session.commit()
 
     monkeypatch.setattr(pattern_store, "get_db_session", fake_get_db_session)
+    monkeypatch.setattr(scene_cluster_store, "get_db_session", fake_get_db_session)
 
 
 def test_build_behavior_feedback_messages_uses_multi_message_context() -> None:
@@ -189,3 +191,45 @@ def test_apply_behavior_feedback_accepts_observed_behavior_path(
     assert feedback_path is not None
     assert feedback_path.score == 0.7
     assert feedback_path.success_count == 1
+
+
+def test_apply_behavior_scene_feedback_clamps_cluster_score(
+    monkeypatch: pytest.MonkeyPatch,
+    behavior_feedback_engine,
+) -> None:
+    _patch_pattern_store_session(monkeypatch, behavior_feedback_engine)
+    with Session(behavior_feedback_engine) as session:
+        clusters = [
+            BehaviorSceneCluster(session_id="session-a", score=5.9),
+            BehaviorSceneCluster(session_id="session-a", score=-3.9),
+            BehaviorSceneCluster(session_id="session-a", score=1.0),
+        ]
+        session.add_all(clusters)
+        session.flush()
+        paths = [
+            BehaviorExperiencePath(
+                session_id="session-a",
+                scene_cluster_id=cluster.id,
+                action_id=1,
+                outcome_id=1,
+            )
+            for cluster in clusters
+        ]
+        session.add_all(paths)
+        session.commit()
+        path_ids = [path.id for path in paths]
+        cluster_ids = [cluster.id for cluster in clusters]
+
+    for path_id, score_delta in zip(path_ids, [10.0, -10.0, 1.0], strict=True):
+        scene_cluster_store.apply_behavior_scene_feedback(
+            experience_path_id=path_id,
+            score_delta=score_delta,
+            status="success" if score_delta > 0 else "failure",
+        )
+
+    with Session(behavior_feedback_engine) as session:
+        scores = [session.get(BehaviorSceneCluster, cluster_id).score for cluster_id in cluster_ids]
+
+    assert scores[0] == 6.0
+    assert scores[1] == -4.0
+    assert scores[2] == pytest.approx(1.08)
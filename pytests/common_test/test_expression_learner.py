@@ -262,3 +262,34 @@ async def test_jargon_learning_runs_when_expression_learning_disabled(monkeypatc
 
     assert wrote_result is True
     assert captured_jargon_entries == jargon_entries
+
+
+@pytest.mark.asyncio
+async def test_check_expression_suitability_reuses_cached_evaluation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """相同情景与风格重复评估时，应复用缓存结论而不再调用 LLM。"""
+    import src.learners.expression_utils as expression_utils_module
+
+    call_count = 0
+
+    async def fake_generate_response(prompt: str, options=None) -> SimpleNamespace:
+        """返回固定评估结果并记录调用次数。"""
+        nonlocal call_count
+        call_count += 1
+        return SimpleNamespace(response='{"suitable": true, "reason": "通用"}')
+
+    from src.prompt.prompt_manager import Prompt, PromptManager
+
+    fake_prompt_manager = PromptManager()
+    fake_prompt_manager.add_prompt(
+        Prompt(prompt_name="expression_evaluation", template="{situation}|{style}|{criteria_list}")
+    )
+    monkeypatch.setattr(expression_utils_module, "prompt_manager", fake_prompt_manager)
+    monkeypatch.setattr(expression_utils_module.judge_llm, "generate_response", fake_generate_response)
+    monkeypatch.setattr(expression_utils_module, "_evaluation_cache", expression_utils_module.OrderedDict())
+
+    first = await expression_utils_module.check_expression_suitability("表示赞同", "说“确实”")
+    second = await expression_utils_module.check_expression_suitability("表示赞同", "说“确实”")
+
+    assert first == (True, "通用", None)
+    assert second == first
+    assert call_count == 1
@@ -0,0 +1,144 @@
+"""测试黑话学习器的数据库写入行为。"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Generator, List
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+import json
+import pytest
+
+from src.common.database.database_model import Jargon, JargonCreatedBy
+from src.learners.jargon_miner import JargonMiner
+
+
+@pytest.fixture(name="jargon_miner_engine")
+def jargon_miner_engine_fixture() -> Generator:
+    """创建用于黑话学习器测试的内存数据库引擎。
+
+    Yields:
+        Generator: 供测试使用的 SQLite 内存引擎。
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+
+
+@pytest.fixture(name="opened_sessions")
+def opened_sessions_fixture(monkeypatch: pytest.MonkeyPatch, jargon_miner_engine) -> List[bool]:
+    """让黑话学习器写入测试数据库，并预置一条已有黑话。
+
+    Returns:
+        List[bool]: 每次打开会话时传入的 ``auto_commit`` 参数。
+    """
+
+    import src.learners.jargon_miner as jargon_miner_module
+
+    with Session(jargon_miner_engine) as session:
+        session.add(
+            Jargon(
+                content="已有黑话",
+                raw_content=json.dumps(["旧上下文"], ensure_ascii=False),
+                session_id_dict=json.dumps({"session-a": 1}),
+                is_global=False,
+                count=1,
+                meaning="",
+                created_by=JargonCreatedBy.AI,
+            )
+        )
+        session.commit()
+
+    opened_sessions: List[bool] = []
+
+    @contextmanager
+    def fake_get_db_session(auto_commit: bool = True) -> Generator[Session, None, None]:
+        """构造带自动提交语义的测试会话工厂，并记录会话打开次数。"""
+
+        opened_sessions.append(auto_commit)
+        session = Session(jargon_miner_engine)
+        try:
+            yield session
+            if auto_commit:
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    class FakeRuntimeManager:
+        async def invoke_hook(self, *args, **kwargs):
+            del args, kwargs
+            return SimpleNamespace(aborted=False, kwargs={})
+
+    monkeypatch.setattr(jargon_miner_module, "get_db_session", fake_get_db_session)
+    monkeypatch.setattr(
+        jargon_miner_module.JargonConfigUtils,
+        "resolve_jargon_group_scope",
+        staticmethod(lambda session_id: ({session_id}, False)),
+    )
+    monkeypatch.setattr(JargonMiner, "_get_runtime_manager", staticmethod(lambda: FakeRuntimeManager()))
+    return opened_sessions
+
+
+@pytest.mark.asyncio
+async def test_process_extracted_entries_commits_batch_once(
+    jargon_miner_engine,
+    opened_sessions: List[bool],
+) -> None:
+    """同一批黑话的新增与更新应在一个事务中完成。"""
+
+    miner = JargonMiner(session_id="session-a", session_name="测试会话")
+    saved, updated = await miner.process_extracted_entries(
+        [
+            {"content": "已有黑话", "raw_content": {"新上下文"}},
+            {"content": "新黑话", "raw_content": {"上下文"}},
+        ]
+    )
+
+    assert (saved, updated) == (1, 1)
+    assert opened_sessions == [True]
+    assert list(miner.cache) == ["已有黑话", "新黑话"]
+    with Session(jargon_miner_engine) as session:
+        jargons = {jargon.content: jargon for jargon in session.exec(select(Jargon)).all()}
+
+    assert jargons["已有黑话"].count == 2
+    assert set(json.loads(jargons["已有黑话"].raw_content)) == {"旧上下文", "新上下文"}
+    assert jargons["新黑话"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_process_extracted_entries_discards_batch_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    jargon_miner_engine,
+    opened_sessions: List[bool],
+) -> None:
+    """任一条目写入失败时整批回滚，且不更新缓存。"""
+
+    def failing_update_jargon(self, jargon: Jargon, raw_content_set) -> None:
+        del self, jargon, raw_content_set
+        raise RuntimeError("写入失败")
+
+    monkeypatch.setattr(JargonMiner, "_update_jargon", failing_update_jargon)
+
+    miner = JargonMiner(session_id="session-a", session_name="测试会话")
+    saved, updated = await miner.process_extracted_entries(
+        [
+            {"content": "新黑话", "raw_content": {"上下文"}},
+            {"content": "已有黑话", "raw_content": {"新上下文"}},
+        ]
+    )
+
+    assert (saved, updated) == (0, 0)
+    assert opened_sessions == [True]
+    assert list(miner.cache) == []
+    with Session(jargon_miner_engine) as session:
+        jargons = {jargon.content: jargon for jargon in session.exec(select(Jargon)).all()}
+
+    assert set(jargons) == {"已有黑话"}
+    assert jargons["已有黑话"].count == 1
@@ -0,0 +1,35 @@
+"""测试出站跟踪器的待完成记录索引。"""
+
+from src.platform_io.outbound_tracker import OutboundTracker
+from src.platform_io.types import DeliveryReceipt, DeliveryStatus, RouteKey
+
+
+def test_pending_lookup_without_driver_requires_single_driver() -> None:
+    """未指定驱动时，只有唯一驱动的待完成记录才能被查询与结束。"""
+
+    tracker = OutboundTracker()
+    route_key = RouteKey(platform="qq")
+    tracker.begin_tracking("msg-1", route_key, "driver-a")
+
+    assert tracker.get_pending("msg-1").driver_id == "driver-a"
+
+    tracker.begin_tracking("msg-1", route_key, "driver-b")
+    assert tracker.get_pending("msg-1") is None
+    assert tracker.get_pending("msg-1", "driver-b").driver_id == "driver-b"
+
+    finished = tracker.finish_tracking(
+        DeliveryReceipt(
+            internal_message_id="msg-1",
+            route_key=route_key,
+            status=DeliveryStatus.SENT,
+            driver_id="driver-a",
+        )
+    )
+    assert finished is not None and finished.driver_id == "driver-a"
+
+    finished = tracker.finish_tracking(
+        DeliveryReceipt(internal_message_id="msg-1", route_key=route_key, status=DeliveryStatus.SENT)
+    )
+    assert finished is not None and finished.driver_id == "driver-b"
+    assert tracker.get_pending("msg-1") is None
+    assert tracker._pending_driver_ids == {}
@@ -18,6 +18,7 @@ from src.prompt.prompt_manager import (  # noqa
     SUFFIX_PROMPT,
     Prompt,
     PromptManager,
+    _parse_template_fields,
     prompt_manager,
 )
 
@@ -887,7 +888,29 @@ def test_formatter_parsing_named_fields_only():
     manager.add_prompt(prompt)
 
     # Act
-    fields = {field_name for _, field_name, _, _ in manager._formatter.parse(prompt.template) if field_name}
+    fields = _parse_template_fields(prompt.template)
 
     # Assert
     assert fields == {"x", "y"}
+
+
+@pytest.mark.asyncio
+async def test_render_reuses_parsed_template_fields():
+    # Arrange
+    from src.prompt.prompt_manager import _parse_template_fields
+
+    manager = PromptManager()
+    manager.add_prompt(Prompt(prompt_name="cached_main", template="Hi {name}, {{raw}}"))
+    _parse_template_fields.cache_clear()
+
+    # Act
+    for _ in range(3):
+        prompt = manager.get_prompt("cached_main")
+        prompt.add_context("name", "Bob")
+        result = await manager.render_prompt(prompt)
+
+    # Assert
+    assert result == "Hi Bob, {raw}"
+    cache_info = _parse_template_fields.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+from typing import Any, List
+
+import asyncio
+
+from src.llm_models.model_client.base_client import ClientProviderRegistration, ClientRegistry
+
+
+def test_loop_bound_client_is_reused_only_within_the_same_loop() -> None:
+    registry = ClientRegistry()
+    created_clients: List[Any] = []
+
+    def factory(api_provider: Any) -> Any:
+        client = SimpleNamespace(api_provider=api_provider)
+        created_clients.append(client)
+        return client
+
+    registry.register_provider(ClientProviderRegistration(client_type="loop-test", factory=factory, builtin=True))
+    api_provider = SimpleNamespace(name="loop-provider", client_type="loop-test")
+
+    async def fetch_twice() -> List[Any]:
+        return [
+            registry.get_loop_bound_client_instance(api_provider),
+            registry.get_loop_bound_client_instance(api_provider),
+        ]
+
+    first_loop_clients = asyncio.run(fetch_twice())
+    second_loop_clients = asyncio.run(fetch_twice())
+
+    assert first_loop_clients[0] is first_loop_clients[1]
+    assert second_loop_clients[0] is second_loop_clients[1]
+    assert first_loop_clients[0] is not second_loop_clients[0]
+    assert len(created_clients) == 2
+
+    registry.clear_client_instance_cache_by_client_type("loop-test")
+    assert registry.loop_bound_client_cache == {}
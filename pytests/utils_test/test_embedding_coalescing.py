@@ -0,0 +1,55 @@
+from typing import List
+
+import asyncio
+import pytest
+
+from src.common.data_models.llm_service_data_models import LLMEmbeddingResult
+from src.llm_models.utils_model import LLMOrchestrator
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_embeddings_share_one_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    orchestrator = LLMOrchestrator.__new__(LLMOrchestrator)
+    orchestrator._inflight_embeddings = {}
+    requested_inputs: List[str] = []
+
+    async def fake_request_embedding(embedding_input: str) -> LLMEmbeddingResult:
+        requested_inputs.append(embedding_input)
+        await asyncio.sleep(0.01)
+        return LLMEmbeddingResult(embedding=[float(len(embedding_input))], model_name="demo-embedding")
+
+    monkeypatch.setattr(orchestrator, "_request_embedding", fake_request_embedding)
+
+    results = await asyncio.gather(
+        orchestrator.get_embedding("你好"),
+        orchestrator.get_embedding("你好"),
+        orchestrator.get_embedding("世界和平"),
+    )
+
+    assert sorted(requested_inputs) == ["世界和平", "你好"]
+    assert [result.embedding for result in results] == [[2.0], [2.0], [4.0]]
+    assert orchestrator._inflight_embeddings == {}
+
+    await orchestrator.get_embedding("你好")
+    assert requested_inputs.count("你好") == 2
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_is_shared_and_released(monkeypatch: pytest.MonkeyPatch) -> None:
+    orchestrator = LLMOrchestrator.__new__(LLMOrchestrator)
+    orchestrator._inflight_embeddings = {}
+
+    async def failing_request_embedding(embedding_input: str) -> LLMEmbeddingResult:
+        await asyncio.sleep(0)
+        raise RuntimeError("获取embedding失败")
+
+    monkeypatch.setattr(orchestrator, "_request_embedding", failing_request_embedding)
+
+    results = await asyncio.gather(
+        orchestrator.get_embedding("你好"),
+        orchestrator.get_embedding("你好"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert orchestrator._inflight_embeddings == {}
@@ -0,0 +1,28 @@
+from typing import List
+
+import pytest
+
+from src.common.data_models.embedding_service_data_models import EmbeddingResult
+from src.services.embedding_service import EmbeddingServiceClient
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent", [None, 4])
+async def test_embed_texts_dedupes_and_fans_out_in_input_order(
+    monkeypatch: pytest.MonkeyPatch,
+    max_concurrent: int | None,
+) -> None:
+    client = EmbeddingServiceClient.__new__(EmbeddingServiceClient)
+    requested_inputs: List[str] = []
+
+    async def fake_embed_text(embedding_input: str) -> EmbeddingResult:
+        requested_inputs.append(embedding_input)
+        return EmbeddingResult(embedding=[float(len(embedding_input))], model_name=embedding_input)
+
+    monkeypatch.setattr(client, "embed_text", fake_embed_text)
+
+    results = await client.embed_texts(["你好", "世界和平", "你好", "a", "世界和平"], max_concurrent=max_concurrent)
+
+    assert sorted(requested_inputs) == sorted(["你好", "世界和平", "a"])
+    assert [result.model_name for result in results] == ["你好", "世界和平", "你好", "a", "世界和平"]
+    assert [result.embedding for result in results] == [[2.0], [4.0], [2.0], [1.0], [4.0]]
@@ -0,0 +1,18 @@
+import pytest
+
+from src.llm_models.utils_model import LLMOrchestrator
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ("  普通回复  ", ("普通回复", "")),
+        ("<think>思考过程</think>\n正文", ("正文", "思考过程")),
+        ("思考过程</think>正文", ("正文", "思考过程")),
+        (" <think>思考</think>正文", ("正文", "<think>思考")),
+        ("<think>第一段</think>中间<think>第二段</think>结尾", ("中间<think>第二段</think>结尾", "第一段")),
+        ("<think>未闭合的思考", ("<think>未闭合的思考", "")),
+    ],
+)
+def test_extract_reasoning_splits_first_think_block(content: str, expected: tuple[str, str]) -> None:
+    assert LLMOrchestrator._extract_reasoning(content) == expected
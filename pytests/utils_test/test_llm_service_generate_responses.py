@@ -0,0 +1,40 @@
+from typing import List
+
+import asyncio
+import pytest
+
+from src.common.data_models.llm_service_data_models import LLMGenerationOptions, LLMResponseResult
+from src.services.llm_service import LLMServiceClient
+
+
+@pytest.mark.asyncio
+async def test_generate_responses_runs_prompts_concurrently_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = LLMServiceClient.__new__(LLMServiceClient)
+    running = 0
+    peak_running = 0
+    received_options: List[LLMGenerationOptions | None] = []
+
+    async def fake_generate_response(
+        prompt: str,
+        options: LLMGenerationOptions | None = None,
+    ) -> LLMResponseResult:
+        nonlocal running, peak_running
+        received_options.append(options)
+        running += 1
+        peak_running = max(peak_running, running)
+        await asyncio.sleep(0.01 * (3 - len(prompt)))
+        running -= 1
+        return LLMResponseResult(response=prompt.upper())
+
+    monkeypatch.setattr(client, "generate_response", fake_generate_response)
+    options = LLMGenerationOptions(temperature=0.3)
+
+    results = await client.generate_responses(["a", "bb"], options)
+    assert [result.response for result in results] == ["A", "BB"]
+    assert peak_running == 2
+    assert received_options == [options, options]
+
+    peak_running = 0
+    results = await client.generate_responses(["a", "bb"], max_concurrent=1)
+    assert [result.response for result in results] == ["A", "BB"]
+    assert peak_running == 1
@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from typing import Generator, List
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+import asyncio
+import pytest
+
+from src.common.database.database_model import ModelUsage
+from src.config.model_configs import ModelInfo
+from src.llm_models import utils as llm_utils
+from src.llm_models.model_client.base_client import UsageRecord
+
+MODEL_INFO = ModelInfo(api_provider="test-provider", model_identifier="demo-model", name="demo-model")
+USAGE = UsageRecord(
+    model_name="demo-model",
+    provider_name="test-provider",
+    prompt_tokens=10,
+    completion_tokens=5,
+    total_tokens=15,
+)
+
+
+@pytest.fixture(name="usage_engine")
+def usage_engine_fixture() -> Generator:
+    """创建用于使用记录测试的内存数据库引擎。"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+
+
+@pytest.fixture(name="committed_sessions")
+def committed_sessions_fixture(monkeypatch: pytest.MonkeyPatch, usage_engine) -> List[int]:
+    """将使用记录写入测试数据库，并记录提交次数。"""
+    committed_sessions: List[int] = []
+
+    @contextmanager
+    def fake_get_db_session(auto_commit: bool = True) -> Generator[Session, None, None]:
+        session = Session(usage_engine)
+        try:
+            yield session
+            if auto_commit:
+                session.commit()
+                committed_sessions.append(1)
+        finally:
+            session.close()
+
+    monkeypatch.setattr(llm_utils, "get_db_session", fake_get_db_session)
+    return committed_sessions
+
+
+def _load_records(engine) -> List[ModelUsage]:
+    with Session(engine) as session:
+        return list(session.exec(select(ModelUsage)).all())
+
+
+@pytest.mark.asyncio
+async def test_main_loop_usage_records_are_buffered_until_flush(
+    monkeypatch: pytest.MonkeyPatch,
+    usage_engine,
+    committed_sessions: List[int],
+) -> None:
+    monkeypatch.setattr(llm_utils, "get_main_loop", asyncio.get_running_loop)
+    recorder = llm_utils.LLMUsageRecorder()
+
+    await asyncio.gather(
+        *(recorder.record_usage(MODEL_INFO, USAGE, "system", "test", "/chat/completions") for _ in range(8))
+    )
+    assert committed_sessions == []
+
+    await recorder.flush()
+
+    records = _load_records(usage_engine)
+    assert len(records) == 8
+    assert len(committed_sessions) == 1
+    assert all(record.total_tokens == 15 for record in records)
+
+
+@pytest.mark.asyncio
+async def test_other_loop_usage_records_bypass_the_shared_buffer(
+    monkeypatch: pytest.MonkeyPatch,
+    usage_engine,
+    committed_sessions: List[int],
+) -> None:
+    monkeypatch.setattr(llm_utils, "get_main_loop", lambda: None)
+    recorder = llm_utils.LLMUsageRecorder()
+
+    await recorder.record_usage(MODEL_INFO, USAGE, "system", "test", "/embeddings")
+
+    assert len(_load_records(usage_engine)) == 1
+    assert len(committed_sessions) == 1
+    assert recorder._pending_records == []
+    assert recorder._flush_task is None
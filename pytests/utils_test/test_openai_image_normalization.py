@@ -0,0 +1,54 @@
+from io import BytesIO
+
+from PIL import Image
+
+import base64
+import pytest
+
+from src.llm_models.model_client import openai_client
+from src.llm_models.payload_content.message import ImageMessagePart
+
+
+def _build_image_base64(image_format: str) -> str:
+    image = Image.new("RGB", (8, 8), (255, 0, 0))
+    buffer = BytesIO()
+    image.save(buffer, format=image_format)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def test_repeated_image_part_is_normalized_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    openai_client._normalized_image_cache.clear()
+    decode_calls = []
+    original_decode = openai_client._decode_and_normalize_image_base64
+
+    def counting_decode(fallback_format: str, image_base64: str):
+        decode_calls.append(fallback_format)
+        return original_decode(fallback_format, image_base64)
+
+    monkeypatch.setattr(openai_client, "_decode_and_normalize_image_base64", counting_decode)
+    part = ImageMessagePart(image_format="gif", image_base64=_build_image_base64("GIF"))
+
+    first = openai_client._build_image_content_part(part)
+    second = openai_client._build_image_content_part(part)
+
+    assert first == second
+    assert first["image_url"]["url"].startswith("data:image/webp;base64,")
+    assert decode_calls == ["gif"]
+
+
+def test_invalid_image_is_not_cached() -> None:
+    openai_client._normalized_image_cache.clear()
+
+    assert openai_client._normalize_image_base64_for_openai("png", "bm90LWFuLWltYWdl") is None
+    assert openai_client._normalize_image_base64_for_openai("png", "bm90LWFuLWltYWdl") is None
+    assert len(openai_client._normalized_image_cache) == 0
+
+
+def test_supported_image_keeps_original_base64() -> None:
+    openai_client._normalized_image_cache.clear()
+    image_base64 = _build_image_base64("PNG")
+    part = ImageMessagePart(image_format="png", image_base64=image_base64)
+
+    assert openai_client._normalize_image_part_for_openai(part) == ("png", image_base64)
+    assert openai_client._normalize_image_part_for_openai(part) == ("png", image_base64)
+    assert list(openai_client._normalized_image_cache.values()) == [("png", None)]
@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import asyncio
+import pytest
+import threading
+import time
+
+from src.llm_models.request_limiter import TokenBucket, get_provider_request_limiter
+
+
+@pytest.mark.asyncio
+async def test_provider_limiter_caps_concurrent_requests() -> None:
+    api_provider = SimpleNamespace(name="limited-provider", max_concurrency=2, requests_per_minute=0)
+    limiter = get_provider_request_limiter(api_provider)
+    assert limiter is not None
+    assert get_provider_request_limiter(api_provider) is limiter
+
+    running = 0
+    peak_running = 0
+
+    async def fake_request() -> None:
+        nonlocal running, peak_running
+        async with limiter.slot():
+            running += 1
+            peak_running = max(peak_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(fake_request() for _ in range(5)))
+    assert peak_running == 2
+
+    api_provider.max_concurrency = 0
+    assert get_provider_request_limiter(api_provider) is None
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_after_burst() -> None:
+    bucket = TokenBucket(rate_per_second=50, capacity=1)
+    started_at = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+
+    assert time.monotonic() - started_at >= 0.035
+
+
+def test_provider_limiter_is_shared_across_event_loops() -> None:
+    api_provider = SimpleNamespace(name="cross-loop-provider", max_concurrency=1, requests_per_minute=0)
+    limiter = get_provider_request_limiter(api_provider)
+    assert limiter is not None
+    state_lock = threading.Lock()
+    running = 0
+    peak_running = 0
+
+    async def fake_requests() -> None:
+        nonlocal running, peak_running
+        assert get_provider_request_limiter(api_provider) is limiter
+        for _ in range(3):
+            async with limiter.slot():
+                with state_lock:
+                    running += 1
+                    peak_running = max(peak_running, running)
+                await asyncio.sleep(0.01)
+                with state_lock:
+                    running -= 1
+
+    threads = [threading.Thread(target=asyncio.run, args=(fake_requests(),)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert peak_running == 1
+    assert limiter.concurrency_limiter is not None
+    assert limiter.concurrency_limiter.active_count == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_concurrency_slot() -> None:
+    api_provider = SimpleNamespace(name="cancel-provider", max_concurrency=1, requests_per_minute=0)
+    limiter = get_provider_request_limiter(api_provider)
+    assert limiter is not None and limiter.concurrency_limiter is not None
+
+    async def hold_slot(release_event: asyncio.Event) -> None:
+        async with limiter.slot():
+            await release_event.wait()
+
+    release_event = asyncio.Event()
+    holder = asyncio.create_task(hold_slot(release_event))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold_slot(asyncio.Event()))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    release_event.set()
+    await holder
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.concurrency_limiter.active_count == 0
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from src.chat.utils import utils as chat_utils
 
 
@@ -33,3 +35,32 @@ def test_splitter_keeps_dash_adjacent_spaces(monkeypatch) -> None:
     assert chat_utils.split_into_sentences_w_remove_punctuation("参数 - 值") == ["参数 - 值"]
     assert chat_utils.split_into_sentences_w_remove_punctuation("参数 —— 值") == ["参数 —— 值"]
     assert chat_utils.split_into_sentences_w_remove_punctuation("参数 — 值") == ["参数 — 值"]
+
+
+def test_calculate_typing_time_applies_current_typing_speed(monkeypatch) -> None:
+    """字符统计被缓存后，打字速度配置的变化仍应实时生效。"""
+
+    monkeypatch.setattr(chat_utils.global_config.chat, "typing_speed", 1.0)
+    assert chat_utils.calculate_typing_time("你好ok") == 0.3 * 2 + 0.15 * 2
+    assert chat_utils.calculate_typing_time("好") == 0.3 * 3 + 0.3
+    assert chat_utils.calculate_typing_time("你好ok", is_emoji=True) == 1
+
+    monkeypatch.setattr(chat_utils.global_config.chat, "typing_speed", 2.0)
+    assert chat_utils.calculate_typing_time("你好ok") == (0.3 * 2 + 0.15 * 2) * 2
+
+
+def test_name_mention_is_matched_after_markup_cleanup(monkeypatch) -> None:
+    """去除 @ 标记后两侧文本拼接成的名称也应视为提及。"""
+
+    monkeypatch.setattr(chat_utils.global_config.bot, "nickname", "麦麦")
+    monkeypatch.setattr(chat_utils.global_config.bot, "alias_names", [])
+    monkeypatch.setattr(chat_utils, "get_bot_account", lambda platform: "")
+    message = SimpleNamespace(
+        processed_plain_text="麦@x（123）麦",
+        platform="test",
+        message_info=SimpleNamespace(additional_config={}),
+        is_mentioned=False,
+        message_segment=None,
+    )
+
+    assert chat_utils.is_mentioned_bot_in_message(message)[0] is True
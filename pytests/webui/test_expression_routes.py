@@ -431,6 +431,63 @@ def test_batch_delete_partial_not_found(client: TestClient, mock_auth, sample_ex
     assert "成功删除 1 个" in data["message"]
 
 
+def test_clear_expressions_only_deletes_target_chat(client: TestClient, mock_auth, test_session: Session):
+    """Test POST /expression/clear deletes only the given chat and reports the deleted count"""
+    for i, chat_id in enumerate(["chat_clear", "chat_clear", "chat_keep"]):
+        test_session.execute(
+            text(
+                f"INSERT INTO expressions (id, situation, style, content_list, count, last_active_time, create_time, session_id, checked) "
+                f"VALUES ({i + 1}, '清除{i}', '风格{i}', '[]', 0, datetime('now'), datetime('now'), '{chat_id}', 0)"
+            )
+        )
+    test_session.commit()
+
+    response = client.post("/api/webui/expression/clear", json={"chat_id": "chat_clear"})
+    assert response.status_code == 200
+    assert response.json()["deleted_count"] == 2
+
+    remaining = test_session.exec(select(Expression.session_id)).all()
+    assert remaining == ["chat_keep"]
+
+
+def test_legacy_import_dedupes_against_existing_target_chats(
+    client: TestClient, mock_auth, test_session: Session, tmp_path
+):
+    """Test POST /expression/legacy-import/import skips pairs already present in each target chat"""
+    import sqlite3
+
+    legacy_db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(legacy_db_path) as legacy_connection:
+        legacy_connection.execute("CREATE TABLE expression (chat_id TEXT, situation TEXT, style TEXT)")
+        legacy_connection.executemany(
+            "INSERT INTO expression VALUES (?, ?, ?)",
+            [("old_chat", "打招呼", "说你好"), ("old_chat", "道别", "说再见")],
+        )
+
+    test_session.execute(
+        text(
+            "INSERT INTO expressions (id, situation, style, content_list, count, last_active_time, create_time, session_id, checked) "
+            "VALUES (1, '打招呼', '说你好', '[]', 0, datetime('now'), datetime('now'), 'chat_a', 0)"
+        )
+    )
+    test_session.commit()
+
+    response = client.post(
+        "/api/webui/expression/legacy-import/import",
+        json={
+            "db_path": str(legacy_db_path),
+            "mappings": [{"old_chat_id": "old_chat", "target_chat_ids": ["chat_a", "chat_b"]}],
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported_count"] == 3
+    assert data["skipped_count"] == 1
+
+    imported_pairs = set(test_session.exec(select(Expression.session_id, Expression.situation)).all())
+    assert imported_pairs == {("chat_a", "打招呼"), ("chat_a", "道别"), ("chat_b", "打招呼"), ("chat_b", "道别")}
+
+
 def test_get_expression_stats(client: TestClient, mock_auth, test_session: Session):
     """Test GET /expression/stats/summary returns correct statistics"""
     for i in range(3):
@@ -93,4 +93,4 @@ class HeartFCMessageReceiver:
 
         except Exception as e:
             logger.error(f"消息处理失败: {e}")
-            print(traceback.format_exc())
+            logger.debug(traceback.format_exc())
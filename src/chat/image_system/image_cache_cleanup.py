@@ -13,6 +13,7 @@ from src.common.database.database import get_db_session
 from src.common.database.database_model import Images, ImageType
 from src.common.logger import get_logger
 from src.common.utils.image_path import StoredImagePathError, resolve_stored_image_path
+from src.manager.async_task_manager import AsyncTask
 
 logger = get_logger("image_cache_cleanup")
 
@@ -278,18 +279,26 @@ def run_image_cache_cleanup(config: ImageCacheCleanupConfigLike) -> ImageCacheCl
     return result
 
 
-async def periodic_image_cache_cleanup() -> None:
+class ImageCacheCleanupTask(AsyncTask):
     """按配置周期执行图片缓存清理。"""
-    from src.config.config import global_config
 
-    while True:
+    def __init__(self) -> None:
+        super().__init__(task_name="Image Cache Cleanup Task")
+
+    def get_run_interval(self) -> float:
+        """根据当前配置计算下一次清理前的等待时间，配置热重载后立即生效。"""
+        from src.config.config import global_config
+
         config = global_config.visual.image_cache_cleanup
-        interval_seconds = _interval_seconds(config)
+        return _interval_seconds(config) if config.enabled else _DISABLED_POLL_SECONDS
 
-        if config.enabled:
-            try:
-                await asyncio.to_thread(run_image_cache_cleanup, config)
-            except Exception as exc:
-                logger.error(f"图片缓存自动清理失败: {exc}", exc_info=True)
+    async def run(self) -> None:
+        from src.config.config import global_config
 
-        await asyncio.sleep(interval_seconds if config.enabled else _DISABLED_POLL_SECONDS)
+        config = global_config.visual.image_cache_cleanup
+        if not config.enabled:
+            return
+        try:
+            await asyncio.to_thread(run_image_cache_cleanup, config)
+        except Exception as exc:
+            logger.error(f"图片缓存自动清理失败: {exc}", exc_info=True)
@@ -233,7 +233,7 @@ class KGManager:
                 progress.update(task, advance=1)
 
         for k, v in synonym_result.items():
-            print(f'"{k}"的相似实体为：{v}')
+            logger.debug(f'"{k}"的相似实体为：{v}')
         return new_edge_cnt
 
     def _update_graph(
@@ -11,6 +11,7 @@ from src.common.database.database import get_db_session
 from src.common.database.database_model import ChatSession
 from src.common.logger import get_logger
 from src.common.utils.utils_session import SessionUtils
+from src.manager.async_task_manager import AsyncTask
 from src.platform_io.route_key_factory import RouteKeyFactory
 
 if TYPE_CHECKING:
@@ -244,19 +245,6 @@ class ChatManager:
             self.sessions.clear()
             raise e
 
-    async def regularly_save_sessions(self, interval_seconds: int = 300):
-        """定期将会话记录保存到数据库中
-
-        Args:
-            interval_seconds: 保存间隔时间，单位为秒，默认为300秒（5分钟）
-        """
-        while True:
-            await asyncio.sleep(interval_seconds)
-            try:
-                await asyncio.to_thread(self.save_all_sessions)
-            except Exception as e:
-                logger.error(f"定期保存会话记录时发生错误: {e}")
-
     def save_all_sessions(self):
         """将内存中的全部会话记录保存到数据库"""
         try:
@@ -500,3 +488,23 @@ class ChatManager:
 
 
 chat_manager = ChatManager()
+
+
+class ChatSessionSaveTask(AsyncTask):
+    """定期将会话记录保存到数据库中"""
+
+    SAVE_INTERVAL = 300
+    """保存间隔时间，单位为秒（5分钟）"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            task_name="Chat Session Save Task",
+            wait_before_start=self.SAVE_INTERVAL,
+            run_interval=self.SAVE_INTERVAL,
+        )
+
+    async def run(self) -> None:
+        try:
+            await asyncio.to_thread(chat_manager.save_all_sessions)
+        except Exception as e:
+            logger.error(f"定期保存会话记录时发生错误: {e}")
@@ -2,10 +2,8 @@
 from datetime import datetime
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-import json
-
 from json_repair import repair_json
-from sqlmodel import select
+from sqlmodel import select, update
 
 from src.chat.message_receive.message import SessionMessage
 from src.common.database.database import get_db_session
@@ -89,7 +87,8 @@ class MaisakaExpressionSelector:
         related_session_ids, has_global_share = self._resolve_expression_group_scope(session_id)
 
         with get_db_session(auto_commit=False) as session:
-            base_query = select(Expression)
+            # 只投影候选需要的列，避免为每行构造完整 ORM 对象并读取 content_list
+            base_query = select(Expression.id, Expression.situation, Expression.style, Expression.count)
             if has_global_share:
                 scoped_query = base_query
             else:
@@ -105,13 +104,13 @@ class MaisakaExpressionSelector:
 
         all_candidates = [
             {
-                "id": expression.id,
-                "situation": expression.situation,
-                "style": expression.style,
-                "count": expression.count if expression.count is not None else 1,
+                "id": expression_id,
+                "situation": situation,
+                "style": style,
+                "count": count if count is not None else 1,
             }
-            for expression in expressions
-            if expression.id is not None and expression.situation and expression.style
+            for expression_id, situation, style, count in expressions
+            if expression_id is not None and situation and style
         ]
         if len(all_candidates) < 10:
             return []
@@ -126,11 +125,17 @@ class MaisakaExpressionSelector:
 
         candidate_pool: List[dict[str, Any]] = []
         seen_ids: set[int] = set()
+        # 互通组内不同会话可能学到完全相同的表达方式，同一情景与风格只保留一条，避免重复内容占用提示词
+        seen_pairs: set[tuple[str, str]] = set()
         for candidate in [*selected_high, *selected_random]:
             candidate_id = candidate.get("id")
             if not isinstance(candidate_id, int) or candidate_id in seen_ids:
                 continue
+            candidate_pair = (candidate["situation"], candidate["style"])
+            if candidate_pair in seen_pairs:
+                continue
             seen_ids.add(candidate_id)
+            seen_pairs.add(candidate_pair)
             candidate_pool.append(candidate)
 
         return candidate_pool
@@ -204,12 +209,17 @@ class MaisakaExpressionSelector:
         if not raw_response.strip():
             return []
         try:
-            parsed_result = json.loads(repair_json(raw_response))
+            # 直接取回解析后的对象，避免 repair_json 序列化后再 json.loads 一遍
+            parsed_result = repair_json(raw_response, return_objects=True, logging=False)
         except Exception:
             logger.warning(f"表达方式选择结果解析失败: {raw_response!r}")
             return []
+        if not isinstance(parsed_result, dict):
+            # repair_json 对无法修复的文本返回空字符串而不是抛出异常
+            logger.warning(f"表达方式选择结果解析失败: {raw_response!r}")
+            return []
 
-        raw_selected_ids = parsed_result.get("selected_ids", []) if isinstance(parsed_result, dict) else []
+        raw_selected_ids = parsed_result.get("selected_ids", [])
         if not isinstance(raw_selected_ids, list):
             return []
 
@@ -444,12 +454,13 @@ class MaisakaExpressionSelector:
     def _update_last_active_time(self, selected_ids: List[int]) -> None:
         if not selected_ids:
             return
+        # 单条 UPDATE 批量刷新活跃时间，避免逐行加载 ORM 对象再回写
         with get_db_session() as session:
-            expressions = session.exec(select(Expression).where(Expression.id.in_(selected_ids))).all()  # type: ignore[attr-defined]
-            now = datetime.now()
-            for expression in expressions:
-                expression.last_active_time = now
-                session.add(expression)
+            session.exec(
+                update(Expression)
+                .where(Expression.id.in_(selected_ids))  # type: ignore[attr-defined]
+                .values(last_active_time=datetime.now())
+            )
 
     async def select_for_reply(
         self,
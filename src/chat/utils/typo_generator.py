@@ -42,6 +42,7 @@ class ChineseTypoGenerator:
 
         self.pinyin_dict = self._create_pinyin_dict()
         self.char_frequency = self._load_or_create_char_frequency()
+        self._word_frequency = None  # jieba 词典词频，首次查询同音词时加载
 
     def _load_or_create_char_frequency(self):
         """
@@ -226,7 +227,22 @@ class ChineseTypoGenerator:
         """
         使用jieba分词，返回词语列表
         """
-        return list(jieba.cut(sentence))
+        return jieba.lcut(sentence)
+
+    def _get_word_frequency(self):
+        """
+        获取jieba词典中的词语及其词频，只在首次调用时读取词典文件
+        """
+        if self._word_frequency is None:
+            dict_path = os.path.join(os.path.dirname(jieba.__file__), "dict.txt")
+            word_frequency = {}
+            with open(dict_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.strip().split()
+                    if len(parts) >= 2:
+                        word_frequency[parts[0]] = float(parts[1])  # 获取词频
+            self._word_frequency = word_frequency
+        return self._word_frequency
 
     def _get_word_homophones(self, word):
         """
@@ -252,15 +268,7 @@ class ChineseTypoGenerator:
         all_combinations = itertools.product(*candidates)
 
         # 获取jieba词典和词频信息
-        dict_path = os.path.join(os.path.dirname(jieba.__file__), "dict.txt")
-        valid_words = {}  # 改用字典存储词语及其频率
-        with open(dict_path, "r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    word_text = parts[0]
-                    word_freq = float(parts[1])  # 获取词频
-                    valid_words[word_text] = word_freq
+        valid_words = self._get_word_frequency()
 
         # 获取原词的词频作为参考
         original_word_freq = valid_words.get(word, 0)
@@ -387,7 +395,7 @@ class ChineseTypoGenerator:
         # 优先从词语错误中选择，如果没有则从单字错误中选择
         correction_suggestion = None
         # 50%概率返回纠正建议
-        if random.random() < 0.5:
+        if random.getrandbits(1):
             if word_typos:
                 wrong_word, correct_word = random.choice(word_typos)
                 correction_suggestion = correct_word
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import ast
@@ -22,6 +23,17 @@ if TYPE_CHECKING:
 
 logger = get_logger("chat_utils")
 _warned_unconfigured_platforms: set[str] = set()
+_typo_generator: Optional[ChineseTypoGenerator] = None
+_typo_generator_config: Optional[Tuple[float, int, float, float]] = None
+# 通用回复格式：回复对象显示为 "(你)" 或 "（你）"
+_REPLY_TO_SELF_PATTERN = re.compile(r"\[回复 .*?(?:\(你\)|（你）)：")
+# 名称/别名提及检测前需要去除的 @ 与回复标记
+_MENTION_MARKUP_PATTERNS = (
+    re.compile(r"@(.+?)（(\d+)）"),
+    re.compile(r"@<(.+?)(?=:(\d+))\:(\d+)>"),
+    re.compile(r"\[回复 (.+?)\(((\d+)|未知id|你)\)：(.+?)\]，说："),
+    re.compile(r"\[回复<(.+?)(?=:(\d+))\:(\d+)>：(.+?)\]，说："),
+)
 
 
 def is_english_letter(char: str) -> bool:
@@ -196,7 +208,7 @@ def is_mentioned_bot_in_message(message: SessionMessage) -> tuple[bool, bool, fl
     # 5) 统一的回复检测逻辑
     if not is_mentioned:
         # 通用回复格式：包含 "(你)" 或 "（你）"
-        if re.search(r"\[回复 .*?\(你\)：", text) or re.search(r"\[回复 .*?（你）：", text):
+        if _REPLY_TO_SELF_PATTERN.search(text):
             is_mentioned = True
         # ID 形式的回复检测
         elif current_account:
@@ -210,11 +222,11 @@ def is_mentioned_bot_in_message(message: SessionMessage) -> tuple[bool, bool, fl
     # 6) 名称/别名 提及（去除 @/回复标记后再匹配）
     if not is_mentioned and keywords:
         msg_content = text
-        # 去除各种 @ 与 回复标记，避免误判
-        msg_content = re.sub(r"@(.+?)（(\d+)）", "", msg_content)
-        msg_content = re.sub(r"@<(.+?)(?=:(\d+))\:(\d+)>", "", msg_content)
-        msg_content = re.sub(r"\[回复 (.+?)\(((\d+)|未知id|你)\)：(.+?)\]，说：", "", msg_content)
-        msg_content = re.sub(r"\[回复<(.+?)(?=:(\d+))\:(\d+)>：(.+?)\]，说：", "", msg_content)
+        # 去除各种 @ 与 回复标记，避免误判；去除后两侧文本会拼接，可能组成名称，因此不能先用原文预筛。
+        # 这些标记都以 "@" 或 "[回复" 开头，不含这两者的大多数消息可直接跳过四次正则替换
+        if "@" in text or "[回复" in text:
+            for pattern in _MENTION_MARKUP_PATTERNS:
+                msg_content = pattern.sub("", msg_content)
         for kw in keywords:
             if kw and kw in msg_content:
                 is_mentioned = True
@@ -494,6 +506,27 @@ def _get_random_default_reply() -> str:
     return random.choice(default_replies)
 
 
+def _get_typo_generator() -> ChineseTypoGenerator:
+    """获取与当前错别字配置对应的生成器，配置不变时复用已构建的拼音与字频表"""
+    global _typo_generator, _typo_generator_config
+    typo_config = global_config.chinese_typo
+    config_key = (
+        typo_config.error_rate,
+        typo_config.min_freq,
+        typo_config.tone_error_rate,
+        typo_config.word_replace_rate,
+    )
+    if _typo_generator is None or _typo_generator_config != config_key:
+        _typo_generator = ChineseTypoGenerator(
+            error_rate=typo_config.error_rate,
+            min_freq=typo_config.min_freq,
+            tone_error_rate=typo_config.tone_error_rate,
+            word_replace_rate=typo_config.word_replace_rate,
+        )
+        _typo_generator_config = config_key
+    return _typo_generator
+
+
 def process_llm_response(text: str, enable_splitter: bool = True, enable_chinese_typo: bool = True) -> list[str]:
     if not global_config.response_post_process.enable_response_post_process:
         return [text]
@@ -525,25 +558,20 @@ def process_llm_response(text: str, enable_splitter: bool = True, enable_chinese
         logger.warning(f"回复过长 ({len(cleaned_text)} 字符)，返回默认回复")
         return [_get_random_default_reply()]
 
-    typo_generator = ChineseTypoGenerator(
-        error_rate=global_config.chinese_typo.error_rate,
-        min_freq=global_config.chinese_typo.min_freq,
-        tone_error_rate=global_config.chinese_typo.tone_error_rate,
-        word_replace_rate=global_config.chinese_typo.word_replace_rate,
-    )
-
     if global_config.response_splitter.enable and enable_splitter:
         split_sentences = split_into_sentences_w_remove_punctuation(cleaned_text)
     else:
         split_sentences = [cleaned_text]
 
+    typo_enabled = global_config.chinese_typo.enable and enable_chinese_typo
+    typo_generator = _get_typo_generator() if typo_enabled else None
     sentences: List[str] = []
     for sentence in split_sentences:
-        if global_config.chinese_typo.enable and enable_chinese_typo:
+        if typo_generator is not None:
             typoed_text, typo_corrections = typo_generator.create_typo_sentence(sentence)
             if typo_corrections:
                 # 50%概率新增正确字/词，50%概率用正确分句替换错别字分句
-                if random.random() < 0.5:
+                if random.getrandbits(1):
                     sentences.append(typoed_text)
                     sentences.append(typo_corrections)
                 else:
@@ -575,6 +603,13 @@ def process_llm_response(text: str, enable_splitter: bool = True, enable_chinese
     return sentences
 
 
+@lru_cache(maxsize=1024)
+def _count_typing_chars(input_string: str) -> Tuple[int, int]:
+    """统计字符串中的中文字符数与其他字符数，短回复高频重复，按文本缓存结果"""
+    chinese_chars = sum("\u4e00" <= char <= "\u9fff" for char in input_string)
+    return chinese_chars, len(input_string) - chinese_chars
+
+
 def calculate_typing_time(
     input_string: str,
     # thinking_start_time: float,
@@ -597,18 +632,17 @@ def calculate_typing_time(
     # chinese_time *= 1 / typing_speed_multiplier
     # english_time *= 1 / typing_speed_multiplier
     # 计算中文字符数
-    chinese_chars = sum("\u4e00" <= char <= "\u9fff" for char in input_string)
+    chinese_chars, other_chars = _count_typing_chars(input_string)
 
     # 如果只有一个中文字符，使用3倍时间
     if chinese_chars == 1 and len(input_string.strip()) == 1:
         return chinese_time * 3 + 0.3  # 加上回车时间
 
     # 正常计算所有字符的输入时间
-    total_time = 0.0
-    for char in input_string:
-        total_time += chinese_time if "\u4e00" <= char <= "\u9fff" else english_time
     if is_emoji:
         total_time = 1
+    else:
+        total_time = chinese_chars * chinese_time + other_chars * english_time
 
     typing_speed = global_config.chat.typing_speed
     if typing_speed <= 0:
@@ -42,6 +42,7 @@ def set_sqlite_pragma(dbapi_connection: "SQLite3Connection", connection_record):
     cursor.execute("PRAGMA cache_size=-64000")  # 负值表示KB,64000KB = 64MB
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")  # 临时表与排序中间结果放在内存中
     cursor.execute("PRAGMA busy_timeout=1000")  # 1秒超时
     cursor.close()
 
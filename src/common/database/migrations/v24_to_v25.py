@@ -36,15 +36,20 @@ def _normalize_scene_cluster_distributions(connection: Connection) -> int:
     rows = connection.exec_driver_sql(
         "SELECT id, tag_distribution FROM behavior_scene_clusters ORDER BY id"
     ).fetchall()
-    migrated_count = 0
-    for cluster_id, raw_distribution in rows:
-        domain_distribution = _domain_only_distribution(raw_distribution)
+    update_params = [
+        (
+            json.dumps(_domain_only_distribution(raw_distribution), ensure_ascii=False, sort_keys=True),
+            int(cluster_id),
+        )
+        for cluster_id, raw_distribution in rows
+    ]
+    if update_params:
+        # 一次 executemany 提交全部更新，避免逐行往返驱动
         connection.exec_driver_sql(
             "UPDATE behavior_scene_clusters SET tag_distribution = ? WHERE id = ?",
-            (json.dumps(domain_distribution, ensure_ascii=False, sort_keys=True), int(cluster_id)),
+            update_params,
         )
-        migrated_count += 1
-    return migrated_count
+    return len(update_params)
 
 
 def _domain_only_distribution(raw_distribution: Any) -> list[dict[str, float | str]]:
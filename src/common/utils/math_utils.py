@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 import hashlib
 import time
@@ -47,6 +48,12 @@ def number_to_short_id(original_id: int, salt: str, length: int = 6) -> str:
     return short_id
 
 
+@lru_cache(maxsize=4096)
+def _format_timestamp_seconds(timestamp_seconds: int, time_format: str) -> str:
+    """按秒级时间戳格式化时间，同一秒内的消息复用格式化结果"""
+    return time.strftime(time_format, time.localtime(timestamp_seconds))
+
+
 def translate_timestamp_to_human_readable(timestamp: float, mode: TimestampMode | str) -> str:
     """将时间戳按照指定模式转换为人类可读的格式
 
@@ -62,7 +69,7 @@ def translate_timestamp_to_human_readable(timestamp: float, mode: TimestampMode
         else:
             raise ValueError(f"不支持的时间戳转换模式: {mode}")
     if mode in [TimestampMode.NORMAL, TimestampMode.NORMAL_NO_YMD]:
-        return time.strftime(mode.value, time.localtime(timestamp))
+        return _format_timestamp_seconds(int(timestamp), mode.value)
     elif mode == TimestampMode.RELATIVE:
         time_diff = time.time() - timestamp
 
@@ -77,7 +84,7 @@ def translate_timestamp_to_human_readable(timestamp: float, mode: TimestampMode
         elif time_diff < 2592000:
             return f"{int(time_diff // 86400)}天前"
         else:
-            return time.strftime(TimestampMode.NORMAL.value, time.localtime(timestamp))
+            return _format_timestamp_seconds(int(timestamp), TimestampMode.NORMAL.value)
     else:
         raise ValueError(f"不支持的时间戳转换模式: {mode}")
 
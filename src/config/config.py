@@ -61,7 +61,7 @@ LEGACY_ENV_PATH: Path = (PROJECT_ROOT / ".env").resolve().absolute()
 A_MEMORIX_LEGACY_CONFIG_PATH: Path = (CONFIG_DIR / "a_memorix.toml").resolve().absolute()
 MMC_VERSION: str = "1.0.0"
 CONFIG_VERSION: str = "8.14.2"
-MODEL_CONFIG_VERSION: str = "1.17.3"
+MODEL_CONFIG_VERSION: str = "1.18.0"
 
 logger = get_logger("config")
 
@@ -203,6 +203,28 @@ class APIProvider(ConfigBase):
     )
     """重试间隔 (如果API调用失败, 重试的间隔时间, 单位: 秒)"""
 
+    max_concurrency: int = Field(
+        default=0,
+        ge=0,
+        json_schema_extra={
+            "x-widget": "input",
+            "x-icon": "layers",
+            "step": 1,
+        },
+    )
+    """最大并发请求数 (同一提供商同时进行中的请求上限, 0 表示不限制)"""
+
+    requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        json_schema_extra={
+            "x-widget": "input",
+            "x-icon": "gauge",
+            "step": 1,
+        },
+    )
+    """每分钟最大请求数 (按令牌桶平滑发放, 0 表示不限制)"""
+
     def model_post_init(self, context: Any = None) -> None:
         """执行 API 提供商配置的后置校验。
 
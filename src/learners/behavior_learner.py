@@ -783,7 +783,8 @@ class BehaviorLearner:
             if session_exists(session_id):
                 return session_id
 
-        if session_exists(self.session_id):
+        # 已作为候选检查过的 learner_session_id 无需再查一次数据库
+        if self.session_id not in candidates and session_exists(self.session_id):
             return self.session_id
 
         logger.warning(
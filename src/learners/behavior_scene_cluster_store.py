@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal, Optional, Sequence
 
-from sqlmodel import Session, select
+from sqlalchemy import func
+from sqlmodel import Session, select, update
 
 import hashlib
 import json
@@ -241,10 +242,6 @@ def _upsert_profile_tag_clusters(session: Session, profile: BehaviorScenarioProf
     session.flush()
 
 
-def _clamp(value: float, minimum: float, maximum: float) -> float:
-    return min(maximum, max(minimum, value))
-
-
 def _normalize_tag_name(
     tag_kind: str,
     value: str,
@@ -765,16 +762,19 @@ def apply_behavior_scene_feedback(
     now = datetime.now()
 
     try:
+        # 单条 UPDATE 在数据库内完成加分与截断，无需先加载路径和场景簇对象
+        scene_cluster_id = (
+            select(BehaviorExperiencePath.scene_cluster_id)
+            .where(BehaviorExperiencePath.id == experience_path_id)
+            .scalar_subquery()
+        )
+        adjusted_score = func.coalesce(BehaviorSceneCluster.score, 0.0) + float(score_delta) * 0.08
         with get_db_session() as session:
-            path = session.get(BehaviorExperiencePath, experience_path_id)
-            if path is None:
-                return
-            cluster = session.get(BehaviorSceneCluster, path.scene_cluster_id)
-            if cluster is None:
-                return
-            cluster.score = _clamp(float(cluster.score or 0.0) + float(score_delta) * 0.08, -4.0, 6.0)
-            cluster.update_time = now
-            session.add(cluster)
+            session.exec(
+                update(BehaviorSceneCluster)
+                .where(BehaviorSceneCluster.id == scene_cluster_id)
+                .values(score=func.max(-4.0, func.min(6.0, adjusted_score)), update_time=now)
+            )
 
     except Exception as exc:
         logger.error(f"更新行为场景簇反馈失败: experience_id={experience_path_id} error={exc}")
@@ -501,14 +501,15 @@ class ExpressionLearner:
         if raw_jargon_entries is not None:
             jargon_entries = self._deserialize_jargon_entries(raw_jargon_entries)
 
+        # 每批次只解析一次聊天流展示名称，黑话与表达日志共用
+        session_display_name = self._get_session_display_name(learning_session_id)
         processed_jargon = False
         if jargon_entries:
             original_jargon_session_id = getattr(jargon_miner, "session_id", None) if jargon_miner is not None else None
             original_jargon_session_name = getattr(jargon_miner, "session_name", None) if jargon_miner is not None else None
             if jargon_miner is not None and learning_session_id != original_jargon_session_id:
-                chat_name = self._get_session_display_name(learning_session_id)
                 jargon_miner.session_id = learning_session_id
-                jargon_miner.session_name = chat_name
+                jargon_miner.session_name = session_display_name
             try:
                 processed_jargon = await self._process_jargon_entries(jargon_entries, pending_messages, jargon_miner)
             finally:
@@ -534,10 +535,12 @@ class ExpressionLearner:
             return False
 
         learnt_expressions_str = "\n".join(f"{situation}->{style}" for situation, style in learnt_expressions)
-        session_display_name = self._get_session_display_name(learning_session_id)
         expression_log_title = "待优化的表达方式" if global_config.expression.expression_self_reflect else "学习到的表达"
         logger.info(f"[{session_display_name}] {expression_log_title}：\n{learnt_expressions_str}")
 
+        # 本批次只读取一次当前会话的表达方式，后续相似匹配与写入都复用这份列表；
+        # 整表读取放到线程中执行，避免阻塞其他聊天流的事件循环
+        session_expressions = await asyncio.to_thread(self._load_session_expressions, learning_session_id)
         wrote_expression = False
         for situation, style in learnt_expressions:
             before_upsert_result = await self._get_runtime_manager().invoke_hook(
@@ -571,6 +574,7 @@ class ExpressionLearner:
                 session_id=learning_session_id,
                 checked=False,
                 modified_by=ModifiedBy.AI if expression_self_reflect else None,
+                session_expressions=session_expressions,
             )
             wrote_expression = wrote_expression or expression is not None
 
@@ -598,7 +602,8 @@ class ExpressionLearner:
             if session_exists(session_id):
                 return session_id
 
-        if session_exists(self.session_id):
+        # 已作为候选检查过的 learner_session_id 无需再查一次数据库
+        if self.session_id not in candidates and session_exists(self.session_id):
             return self.session_id
 
         logger.warning(
@@ -913,6 +918,7 @@ class ExpressionLearner:
         session_id: str,
         checked: bool = False,
         modified_by: Optional[ModifiedBy] = None,
+        session_expressions: Optional[List[MaiExpression]] = None,
     ) -> Optional[MaiExpression]:
         """将表达方式写入数据库，存在时更新，不存在时新增。
 
@@ -922,8 +928,14 @@ class ExpressionLearner:
             session_id: 表达方式归属的真实会话 ID。
             checked: 是否已经完成人工审核。
             modified_by: 最后修改者标记。
+            session_expressions: 预先加载的会话表达方式列表；提供时直接在其中匹配，
+                并把新建的表达方式追加进去，供同一批次的后续条目复用。
         """
-        expr, similarity = self._find_similar_expression(situation, session_id=session_id) or (None, 0)
+        expr, similarity = self._find_similar_expression(
+            situation,
+            session_id=session_id,
+            candidates=session_expressions,
+        ) or (None, 0)
         if expr:
             # 根据相似度决定是否使用 LLM 总结
             # 完全匹配（相似度 == 1.0）时不总结，相似匹配时总结
@@ -936,13 +948,16 @@ class ExpressionLearner:
                 modified_by=modified_by,
             )
         # 没有找到匹配的记录，创建新记录
-        return self._create_expression(
+        new_expression = self._create_expression(
             situation,
             style,
             session_id=session_id,
             checked=checked,
             modified_by=modified_by,
         )
+        if new_expression is not None and session_expressions is not None:
+            session_expressions.append(new_expression)
+        return new_expression
 
     def _create_expression(
         self,
@@ -1087,8 +1102,30 @@ class ExpressionLearner:
             logger.error(f"使用 LLM 生成表达方式概括失败: {e}")
         return None
 
+    def _load_session_expressions(self, session_id: str) -> List[MaiExpression]:
+        """一次性读取指定会话下的全部表达方式。
+
+        Args:
+            session_id: 表达方式归属的真实会话 ID。
+
+        Returns:
+            List[MaiExpression]: 会话下的表达方式列表，读取失败时返回空列表。
+        """
+        try:
+            with get_db_session(auto_commit=False) as session:
+                statement = select(Expression).filter_by(session_id=session_id)
+                return [MaiExpression.from_db_instance(db_expression) for db_expression in session.exec(statement).all()]
+        except Exception as e:
+            logger.error(f"读取会话表达方式失败: {e}")
+        return []
+
     def _find_similar_expression(
-        self, situation: str, *, session_id: str, similarity_threshold: float = 0.75
+        self,
+        situation: str,
+        *,
+        session_id: str,
+        similarity_threshold: float = 0.75,
+        candidates: Optional[List[MaiExpression]] = None,
     ) -> Optional[Tuple[MaiExpression, float]]:
         """在数据库中查找相似的表达方式。
 
@@ -1096,39 +1133,37 @@ class ExpressionLearner:
             situation: 当前待匹配的情景描述。
             session_id: 表达方式归属的真实会话 ID。
             similarity_threshold: 认定为相似表达方式的最低相似度阈值。
+            candidates: 预先加载的会话表达方式列表；为空时从数据库读取。
 
         Returns:
             Optional[Tuple[MaiExpression, float]]: 若找到最相似的表达方式，则返回
             ``(表达方式对象, 相似度)``；否则返回 ``None``。
         """
-        try:
-            with get_db_session(auto_commit=False) as session:
-                statement = select(Expression).filter_by(session_id=session_id)
-                expressions = session.exec(statement).all()
-
-                best_match: Optional[MaiExpression] = None
-                best_similarity = 0.0
-
-                for db_expression in expressions:
-                    expression = MaiExpression.from_db_instance(db_expression)
-                    candidate_situations = [expression.situation, *expression.content]
-                    for candidate_situation in candidate_situations:
-                        normalized_candidate_situation = candidate_situation.strip()
-                        if not normalized_candidate_situation:
-                            continue
-                        similarity = difflib.SequenceMatcher(
-                            None,
-                            situation,
-                            normalized_candidate_situation,
-                        ).ratio()
-                        if similarity > similarity_threshold and similarity > best_similarity:
-                            best_similarity = similarity
-                            best_match = expression
-
-            if best_match:
-                logger.debug(f"找到相似表达方式情景 [ID: {best_match.item_id}]，相似度: {best_similarity:.2f}")
-                return best_match, best_similarity
+        expressions = candidates if candidates is not None else self._load_session_expressions(session_id)
 
-        except Exception as e:
-            logger.error(f"查找相似表达方式失败: {e}")
+        best_match: Optional[MaiExpression] = None
+        best_similarity = 0.0
+
+        for expression in expressions:
+            candidate_situations = [expression.situation, *expression.content]
+            for candidate_situation in candidate_situations:
+                normalized_candidate_situation = candidate_situation.strip()
+                if not normalized_candidate_situation:
+                    continue
+                if normalized_candidate_situation == situation:
+                    # 完全匹配已是最高相似度，后续候选不可能更优
+                    logger.debug(f"找到相同表达方式情景 [ID: {expression.item_id}]")
+                    return expression, 1.0
+                similarity = difflib.SequenceMatcher(
+                    None,
+                    situation,
+                    normalized_candidate_situation,
+                ).ratio()
+                if similarity > similarity_threshold and similarity > best_similarity:
+                    best_similarity = similarity
+                    best_match = expression
+
+        if best_match:
+            logger.debug(f"找到相似表达方式情景 [ID: {best_match.item_id}]，相似度: {best_similarity:.2f}")
+            return best_match, best_similarity
         return None
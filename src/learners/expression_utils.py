@@ -1,6 +1,9 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import hashlib
 import json
 import re
-from typing import Any, Dict, List, Optional, Tuple
 
 from json_repair import repair_json
 
@@ -13,6 +16,16 @@ logger = get_logger("expression_utils")
 
 judge_llm = LLMServiceClient(task_name="learner", request_type="expression.check")
 
+_JSON_CODE_FENCE_PATTERN = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+_CODE_FENCE_START_PATTERN = re.compile(r"^```\s*", re.MULTILINE)
+_CODE_FENCE_END_PATTERN = re.compile(r"```\s*$", re.MULTILINE)
+_REASON_KEY_PATTERN = re.compile(r'["“”]?reason["“”]?\s*:\s*', re.IGNORECASE)
+_SUITABLE_VALUE_PATTERN = re.compile(r'["“”]?suitable["“”]?\s*:\s*(true|false)', re.IGNORECASE)
+
+_EVALUATION_CACHE_SIZE = 512
+_evaluation_cache: "OrderedDict[str, Tuple[bool, str]]" = OrderedDict()
+"""表达方式评估结果缓存，键为渲染后评估 Prompt 的 SHA-256，只缓存成功解析的结果"""
+
 
 def _normalize_repair_json_result(repaired_result: Any) -> str:
     """将 `repair_json` 的返回结果统一转换为字符串。"""
@@ -29,10 +42,10 @@ def _normalize_repair_json_result(repaired_result: Any) -> str:
 def _strip_markdown_code_fence(text: str) -> str:
     """移除 LLM 可能附带的 Markdown 代码块包裹。"""
     raw = text.strip()
-    if match := re.search(r"```json\s*(.*?)\s*```", raw, re.DOTALL):
+    if match := _JSON_CODE_FENCE_PATTERN.search(raw):
         return match[1].strip()
-    raw = re.sub(r"^```\s*", "", raw, flags=re.MULTILINE)
-    raw = re.sub(r"```\s*$", "", raw, flags=re.MULTILINE)
+    raw = _CODE_FENCE_START_PATTERN.sub("", raw)
+    raw = _CODE_FENCE_END_PATTERN.sub("", raw)
     return raw.strip()
 
 
@@ -47,7 +60,7 @@ def _extract_json_object_candidate(text: str) -> str:
 
 def _extract_reason_from_text(text: str) -> Optional[str]:
     """从格式不完整的 JSON 文本中兜底提取 reason 字段。"""
-    reason_key_match = re.search(r'["“”]?reason["“”]?\s*:\s*', text, re.IGNORECASE)
+    reason_key_match = _REASON_KEY_PATTERN.search(text)
     if reason_key_match is None:
         return None
 
@@ -116,7 +129,7 @@ def parse_evaluation_response(response: str) -> Dict[str, Any]:
                     parsed["reason"] = _normalize_reason_text(parsed["reason"])
                 return parsed
 
-    suitable_match = re.search(r'["“”]?suitable["“”]?\s*:\s*(true|false)', raw, re.IGNORECASE)
+    suitable_match = _SUITABLE_VALUE_PATTERN.search(raw)
     reason = _extract_reason_from_text(json_candidate or raw)
     if suitable_match is None or reason is None:
         raise ValueError(f"无法解析 LLM 响应为评估结果 JSON: {response}")
@@ -154,6 +167,13 @@ async def check_expression_suitability(situation: str, style: str) -> Tuple[bool
 
     prompt = await prompt_manager.render_prompt(prompt_template)
 
+    # 同一情景与风格在不同批次中经常被重复评估，Prompt 完全相同时直接复用上次结论
+    cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    if (cached_result := _evaluation_cache.get(cache_key)) is not None:
+        _evaluation_cache.move_to_end(cache_key)
+        logger.debug(f"命中表达方式评估缓存: situation={situation}, style={style}")
+        return cached_result[0], cached_result[1], None
+
     logger.info(f"正在评估表达方式: situation={situation}, style={style}")
 
     generation_result = await judge_llm.generate_response(
@@ -173,6 +193,9 @@ async def check_expression_suitability(situation: str, style: str) -> Tuple[bool
         suitable = bool(evaluation.get("suitable", False))
         reason = _normalize_reason_text(evaluation.get("reason", "未提供理由"))
         logger.debug(f"评估结果: {'通过' if suitable else '不通过'}")
+        _evaluation_cache[cache_key] = (suitable, reason)
+        if len(_evaluation_cache) > _EVALUATION_CACHE_SIZE:
+            _evaluation_cache.popitem(last=False)
         return suitable, reason, None
     except Exception as e:
         return False, f"评估结果格式错误: {e}", str(e)
@@ -180,6 +203,9 @@ async def check_expression_suitability(situation: str, style: str) -> Tuple[bool
 
 def fix_chinese_quotes_in_json(text: str) -> str:
     """使用状态机修复 JSON 字符串值中的中文引号。"""
+    if "“" not in text and "”" not in text:
+        # 没有中文引号时无需逐字符扫描
+        return text
     result: List[str] = []
     in_string = False
     escape_next = False
@@ -279,7 +305,8 @@ def _try_parse(text: str) -> Any:
         return json.loads(text)
     except Exception:
         try:
-            repaired = _normalize_repair_json_result(repair_json(text))
+            # 上面的 json.loads 已经失败，跳过 repair_json 内部重复的一次标准解析
+            repaired = _normalize_repair_json_result(repair_json(text, skip_json_loads=True))
             return json.loads(repaired)
         except Exception:
             return None
@@ -457,9 +457,14 @@ class JargonMiner:
         """
         处理已提取的黑话条目（从 expression_learner 路由过来的）
 
+        整批条目在同一个事务中写入：任一条目写入失败时整批回滚，不更新缓存也不触发推断。
+
         Args:
             entries: 黑话条目列表
             person_name_filter: 可选的过滤函数，用于检查内容是否包含人物名称
+
+        Returns:
+            Tuple[int, int]: (新增条数, 更新条数)；整批写入失败时返回 (0, 0)
         """
         if not entries:
             return 0, 0
@@ -496,73 +501,79 @@ class JargonMiner:
 
         saved = 0
         updated = 0
-        for entry in uniq_entries:
-            content = entry["content"]
-            raw_content_set = entry["raw_content"]
-            try:
-                with get_db_session(auto_commit=False) as session:
+        cached_contents: List[str] = []
+        inference_jargon_ids: List[int] = []
+        related_session_ids, _ = JargonConfigUtils.resolve_jargon_group_scope(self.session_id)
+        try:
+            # 整批查询与写入共用一个事务，只在末尾提交一次，避免逐条提交带来的多次落盘
+            with get_db_session() as session:
+                for entry in uniq_entries:
+                    content = entry["content"]
+                    raw_content_set = entry["raw_content"]
                     jargon_items = session.exec(select(Jargon).filter_by(content=content)).all()
-            except Exception as e:
-                logger.error(f"查询黑话 '{content}' 失败: {e}")
-                continue
-            related_session_ids, _ = JargonConfigUtils.resolve_jargon_group_scope(self.session_id)
-            # 找匹配项
-            matched_jargon: Optional[Jargon] = None
-            matched_ai_jargon: Optional[Jargon] = None
-            for item in jargon_items:
-                item_matches_scope = False
-                if item.is_global:
-                    item_matches_scope = True
-                elif item.session_id_dict:
-                    try:
-                        session_id_dict = json.loads(item.session_id_dict)
-                        item_matches_scope = bool(related_session_ids.intersection(session_id_dict))
-                    except Exception as e:
-                        logger.error(f"解析Jargon id={item.id} session_id_list失败: {e}")
-                        continue
-
-                if not item_matches_scope:
-                    continue
-                if item.created_by == JargonCreatedBy.MANUAL:
-                    matched_jargon = item
-                    break
-                if matched_ai_jargon is None:
-                    matched_ai_jargon = item
-            matched_jargon = matched_jargon or matched_ai_jargon
-            if matched_jargon:
-                if matched_jargon.created_by == JargonCreatedBy.MANUAL:
-                    logger.debug(f"黑话 '{content}' 已存在手动记录，跳过 AI 更新与推断")
-                    self._add_to_cache(content)
-                    continue
-                # 已存在记录，更新count和raw_content
-                self._update_jargon(matched_jargon, raw_content_set)
-                if self._should_infer_meaning(matched_jargon):
-                    asyncio.create_task(self._infer_meaning_by_id(matched_jargon.id))  # type: ignore
-                updated += 1
-            else:
-                # 没找到匹配记录，创建新记录
-                session_dict_str = json.dumps({self.session_id: 1})
-                now = datetime.now()
-                new_jargon = Jargon(
-                    content=content,
-                    raw_content=json.dumps(list(raw_content_set), ensure_ascii=False),
-                    session_id_dict=session_dict_str,
-                    is_global=False,
-                    count=1,
-                    meaning="",
-                    created_by=JargonCreatedBy.AI,
-                    created_timestamp=now,
-                    updated_timestamp=now,
-                )
-                try:
-                    with get_db_session() as session:
+                    # 找匹配项
+                    matched_jargon: Optional[Jargon] = None
+                    matched_ai_jargon: Optional[Jargon] = None
+                    for item in jargon_items:
+                        item_matches_scope = False
+                        if item.is_global:
+                            item_matches_scope = True
+                        elif item.session_id_dict:
+                            try:
+                                session_id_dict = json.loads(item.session_id_dict)
+                                item_matches_scope = bool(related_session_ids.intersection(session_id_dict))
+                            except Exception as e:
+                                logger.error(f"解析Jargon id={item.id} session_id_list失败: {e}")
+                                continue
+
+                        if not item_matches_scope:
+                            continue
+                        if item.created_by == JargonCreatedBy.MANUAL:
+                            matched_jargon = item
+                            break
+                        if matched_ai_jargon is None:
+                            matched_ai_jargon = item
+                    matched_jargon = matched_jargon or matched_ai_jargon
+                    if matched_jargon:
+                        if matched_jargon.created_by == JargonCreatedBy.MANUAL:
+                            logger.debug(f"黑话 '{content}' 已存在手动记录，跳过 AI 更新与推断")
+                            cached_contents.append(content)
+                            continue
+                        # 已存在记录，更新count和raw_content
+                        self._update_jargon(matched_jargon, raw_content_set)
+                        session.add(matched_jargon)
+                        if self._should_infer_meaning(matched_jargon):
+                            inference_jargon_ids.append(matched_jargon.id)  # type: ignore
+                        cached_contents.append(content)
+                        updated += 1
+                    else:
+                        # 没找到匹配记录，创建新记录
+                        session_dict_str = json.dumps({self.session_id: 1})
+                        now = datetime.now()
+                        new_jargon = Jargon(
+                            content=content,
+                            raw_content=json.dumps(list(raw_content_set), ensure_ascii=False),
+                            session_id_dict=session_dict_str,
+                            is_global=False,
+                            count=1,
+                            meaning="",
+                            created_by=JargonCreatedBy.AI,
+                            created_timestamp=now,
+                            updated_timestamp=now,
+                        )
                         session.add(new_jargon)
-                        session.flush()
-                    saved += 1
-                    self._add_to_cache(content)
-                except Exception as e:
-                    logger.error(f"保存新黑话 '{content}' 失败: {e}")
-                    continue
+                        cached_contents.append(content)
+                        saved += 1
+        except Exception as e:
+            logger.error(f"[{self.session_name}] 写入黑话失败，本批 {len(uniq_entries)} 条均未写入: {e}")
+            return 0, 0
+
+        # 事务提交成功后再更新缓存并触发推断，保证推断任务读取到的是已落库的数据
+        for content in cached_contents:
+            self._add_to_cache(content)
+        for jargon_id in inference_jargon_ids:
+            asyncio.create_task(self._infer_meaning_by_id(jargon_id))
+
         # 固定输出提取的jargon结果，格式化为可读形式（只要有提取结果就输出）
         if uniq_entries:
             # 收集所有提取的jargon内容
@@ -592,10 +603,10 @@ class JargonMiner:
                 logger.debug(f"缓存已满，移除最旧的黑话: {removed_content}")
 
     def _update_jargon(self, db_jargon: Jargon, raw_content_set: Set[str]) -> None:
-        """更新已有黑话记录并写回数据库。
+        """在调用方的会话中更新已命中的黑话记录，由调用方统一提交。
 
         Args:
-            db_jargon: 已命中的黑话 ORM 对象。
+            db_jargon: 已命中且绑定在当前会话上的黑话 ORM 对象。
             raw_content_set: 本次新增的原始上下文集合。
         """
         if db_jargon.created_by == JargonCreatedBy.MANUAL:
@@ -618,23 +629,6 @@ class JargonMiner:
         session_id_dict[self.session_id] = session_id_dict.get(self.session_id, 0) + 1
         db_jargon.session_id_dict = json.dumps(session_id_dict)
 
-        try:
-            with get_db_session() as session:
-                if db_jargon.id is None:
-                    raise ValueError("黑话记录缺少 id，无法更新数据库")
-                statement = select(Jargon).filter_by(id=db_jargon.id).limit(1)
-                if persisted_jargon := session.exec(statement).first():
-                    persisted_jargon.count = db_jargon.count
-                    persisted_jargon.raw_content = db_jargon.raw_content
-                    persisted_jargon.session_id_dict = db_jargon.session_id_dict
-                    persisted_jargon.is_global = db_jargon.is_global
-                    persisted_jargon.updated_timestamp = db_jargon.updated_timestamp
-                    session.add(persisted_jargon)
-                else:
-                    logger.warning(f"黑话 ID {db_jargon.id} 在数据库中未找到，无法更新")
-        except Exception as e:
-            logger.error(f"更新黑话 '{db_jargon.content}' 失败: {e}")
-
     def _parse_result(self, response: str) -> Optional[Dict[str, str]]:
         try:
             result = json.loads(response.strip())
@@ -1,6 +1,9 @@
-import random
+from typing import Any, Dict, List, Optional
+
 import json
-from typing import Optional, List, Dict, Any
+import random
+
+import numpy as np
 
 from src.common.logger import get_logger
 from src.config.config import global_config
@@ -9,6 +12,32 @@ from src.config.config import global_config
 logger = get_logger("learner_utils")
 
 
+def _parse_counts(population: List[Dict]) -> np.ndarray:
+    """将表达的count字段解析为非负浮点数组，无法解析的按1处理。"""
+    counts = np.empty(len(population), dtype=np.float64)
+    for idx, item in enumerate(population):
+        try:
+            counts[idx] = float(item.get("count", 1))
+        except (TypeError, ValueError):
+            counts[idx] = 1.0
+    return np.maximum(counts, 0.0)
+
+
+def _compute_weights_array(counts: np.ndarray) -> np.ndarray:
+    """
+    _compute_weights 的向量化版本，对整组count一次性计算权重。
+    count线性映射到[1,5]区间，全部相等时权重均为1。
+    """
+    if counts.size == 0:
+        return np.empty(0, dtype=np.float64)
+
+    min_count = counts.min()
+    count_range = counts.max() - min_count
+    if count_range == 0:
+        return np.ones_like(counts)
+    return 1.0 + (counts - min_count) / count_range * 4.0
+
+
 def _compute_weights(population: List[Dict]) -> List[float]:
     """
     根据表达的count计算权重，范围限定在1~5之间。
@@ -16,29 +45,7 @@ def _compute_weights(population: List[Dict]) -> List[float]:
     """
     if not population:
         return []
-
-    counts = []
-    for item in population:
-        count = item.get("count", 1)
-        try:
-            count_value = float(count)
-        except (TypeError, ValueError):
-            count_value = 1.0
-        counts.append(max(count_value, 0.0))
-
-    min_count = min(counts)
-    max_count = max(counts)
-
-    if max_count == min_count:
-        weights = [1.0 for _ in counts]
-    else:
-        weights = []
-        for count_value in counts:
-            # 线性映射到[1,5]区间
-            normalized = (count_value - min_count) / (max_count - min_count)
-            weights.append(1.0 + normalized * 4.0)  # 1~5
-
-    return weights
+    return _compute_weights_array(_parse_counts(population)).tolist()
 
 
 def weighted_sample(population: List[Dict], k: int) -> List[Dict]:
@@ -60,23 +67,23 @@ def weighted_sample(population: List[Dict], k: int) -> List[Dict]:
 
     selected: List[Dict] = []
     population_copy = population.copy()
+    # count只解析一次，之后每轮抽样只在剩余元素上做数组运算
+    remaining_counts = _parse_counts(population_copy)
 
     for _ in range(min(k, len(population_copy))):
-        weights = _compute_weights(population_copy)
-        total_weight = sum(weights)
+        weights = _compute_weights_array(remaining_counts)
+        cumulative = np.cumsum(weights)
+        total_weight = float(cumulative[-1])
         if total_weight <= 0:
             # 回退到均匀随机
             idx = random.randint(0, len(population_copy) - 1)
-            selected.append(population_copy.pop(idx))
-            continue
-
-        threshold = random.uniform(0, total_weight)
-        cumulative = 0.0
-        for idx, weight in enumerate(weights):
-            cumulative += weight
-            if threshold <= cumulative:
-                selected.append(population_copy.pop(idx))
-                break
+        else:
+            threshold = random.uniform(0, total_weight)
+            # 第一个累计权重不小于阈值的位置，等价于逐项累加比较
+            idx = min(int(np.searchsorted(cumulative, threshold, side="left")), len(population_copy) - 1)
+
+        selected.append(population_copy.pop(idx))
+        remaining_counts = np.delete(remaining_counts, idx)
 
     return selected
 
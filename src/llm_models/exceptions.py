@@ -46,8 +46,8 @@ class RespNotOkException(Exception):
         self.message = message
 
     def __str__(self):
-        if self.status_code in error_code_mapping:
-            return error_code_mapping[self.status_code]
+        if mapped_message := error_code_mapping.get(self.status_code):
+            return mapped_message
         elif self.message:
             return self.message
         else:
@@ -1,6 +1,7 @@
 from importlib import import_module
 
 from src.config.config import config_manager
+from src.config.model_configs import APIProvider
 
 _CLIENT_MODULE_BY_TYPE: dict[str, str] = {
     "openai": ".openai_client",
@@ -8,6 +9,7 @@ _CLIENT_MODULE_BY_TYPE: dict[str, str] = {
 }
 
 _LOADED_CLIENT_TYPES: set[str] = set()
+_checked_api_providers: list[APIProvider] | None = None
 
 
 def ensure_client_type_loaded(client_type: str) -> None:
@@ -21,8 +23,14 @@ def ensure_client_type_loaded(client_type: str) -> None:
 
 
 def ensure_configured_clients_loaded() -> None:
-    for provider in config_manager.get_model_config().api_providers:
+    # 每次选模型都会调用；同一份提供商配置只需检查一次，热重载替换配置后再重新检查
+    global _checked_api_providers
+    api_providers = config_manager.get_model_config().api_providers
+    if api_providers is _checked_api_providers:
+        return
+    for provider in api_providers:
         ensure_client_type_loaded(provider.client_type)
+    _checked_api_providers = api_providers
 
 
 ensure_configured_clients_loaded()
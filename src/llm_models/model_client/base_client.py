@@ -240,6 +240,8 @@ class ClientRegistry:
         """APIProvider.client_type -> Provider 注册信息映射表。"""
         self.client_instance_cache: Dict[str, BaseClient] = {}
         """APIProvider.name -> BaseClient的映射表"""
+        self.loop_bound_client_cache: Dict[str, Tuple[asyncio.AbstractEventLoop, BaseClient]] = {}
+        """APIProvider.name -> (创建时所在事件循环, BaseClient) 的映射表，供可能跨事件循环调用的请求复用"""
         self._owner_client_types: Dict[str, Set[str]] = {}
         """插件 ID -> 该插件拥有的 client_type 集合。"""
         config_manager.register_reload_callback(self.clear_client_instance_cache)
@@ -429,6 +431,14 @@ class ClientRegistry:
         for provider_name in stale_provider_names:
             self.client_instance_cache.pop(provider_name, None)
 
+        stale_loop_bound_provider_names = [
+            provider_name
+            for provider_name, (_, client) in self.loop_bound_client_cache.items()
+            if client.api_provider.client_type == normalized_client_type
+        ]
+        for provider_name in stale_loop_bound_provider_names:
+            self.loop_bound_client_cache.pop(provider_name, None)
+
     def get_client_class_instance(self, api_provider: APIProvider, force_new: bool = False) -> BaseClient:
         """获取注册的 API 客户端实例。
 
@@ -457,9 +467,31 @@ class ClientRegistry:
                 raise KeyError(f"'{api_provider.client_type}' 类型的 Client 未注册")
         return self.client_instance_cache[api_provider.name]
 
+    def get_loop_bound_client_instance(self, api_provider: APIProvider) -> BaseClient:
+        """获取绑定到当前事件循环的 API 客户端实例。
+
+        客户端内部的连接池与创建它的事件循环绑定。嵌入等请求可能在临时事件循环中执行，
+        因此仅当缓存实例创建于当前运行中的事件循环时才复用，否则新建并替换缓存。
+
+        Args:
+            api_provider: APIProvider 实例。
+
+        Returns:
+            BaseClient: 可在当前事件循环中安全使用的客户端实例。
+        """
+        running_loop = asyncio.get_running_loop()
+        cached_entry = self.loop_bound_client_cache.get(api_provider.name)
+        if cached_entry is not None and cached_entry[0] is running_loop:
+            return cached_entry[1]
+
+        client = self.get_client_class_instance(api_provider, force_new=True)
+        self.loop_bound_client_cache[api_provider.name] = (running_loop, client)
+        return client
+
     def clear_client_instance_cache(self) -> None:
         """清空客户端实例缓存。"""
         self.client_instance_cache.clear()
+        self.loop_bound_client_cache.clear()
         logger.info("检测到配置重载，已清空LLM客户端实例缓存")
 
 
@@ -1,9 +1,12 @@
 import asyncio
 import base64
 import binascii
+import hashlib
 import io
 import json
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -79,6 +82,20 @@ DEBUG_REPLY_CACHE_DIR = Path("logs/debug_reply_cache")
 SUPPORTED_OPENAI_IMAGE_FORMATS = {"jpeg", "png", "webp"}
 """OpenAI 兼容图片输入稳定支持的格式集合。"""
 
+IMAGE_DATA_URL_PREFIXES: Dict[str, str] = {
+    image_format: f"data:image/{image_format};base64," for image_format in SUPPORTED_OPENAI_IMAGE_FORMATS
+}
+"""各图片格式对应的 Data URL 前缀。"""
+
+NORMALIZED_IMAGE_CACHE_SIZE = 8
+"""图片规范化结果缓存的最大条目数。"""
+
+_normalized_image_cache: "OrderedDict[Tuple[str, bytes], Tuple[str, str | None]]" = OrderedDict()
+"""(回退格式, 图片摘要) -> (规范化格式, 转码后的 Base64) 的缓存；Base64 为 ``None`` 表示沿用原图数据。"""
+
+_normalized_image_cache_lock = threading.Lock()
+"""保护图片规范化缓存的线程锁。"""
+
 THINK_CONTENT_PATTERN = re.compile(
     r"<think>(?P<think>.*?)</think>(?P<content>.*)|<think>(?P<think_unclosed>.*)|(?P<content_only>.+)",
     re.DOTALL,
@@ -236,6 +253,25 @@ def _build_text_content_part(text: str) -> ChatCompletionContentPartTextParam:
     }
 
 
+def _build_image_url_content_part(image_format: str, image_base64: str) -> ChatCompletionContentPartImageParam:
+    """根据规范化后的图片数据构建 Data URL 图片片段。
+
+    Args:
+        image_format: 规范化后的图片格式。
+        image_base64: 图片的 Base64 编码。
+
+    Returns:
+        ChatCompletionContentPartImageParam: OpenAI 兼容的图片片段。
+    """
+    prefix = IMAGE_DATA_URL_PREFIXES[image_format]
+    return {
+        "type": "image_url",
+        "image_url": {
+            "url": prefix + image_base64,
+        },
+    }
+
+
 def _build_image_content_part(part: ImageMessagePart) -> ChatCompletionContentPartImageParam:
     """构建图片内容片段。
 
@@ -250,12 +286,7 @@ def _build_image_content_part(part: ImageMessagePart) -> ChatCompletionContentPa
         raise ValueError("图片数据无效，无法构建图片消息片段")
 
     image_format, image_base64 = normalized_image
-    return {
-        "type": "image_url",
-        "image_url": {
-            "url": f"data:image/{image_format};base64,{image_base64}",
-        },
-    }
+    return _build_image_url_content_part(image_format, image_base64)
 
 
 def _normalize_image_part_for_openai(part: ImageMessagePart) -> Tuple[str, str] | None:
@@ -264,23 +295,73 @@ def _normalize_image_part_for_openai(part: ImageMessagePart) -> Tuple[str, str]
     Args:
         part: 内部图片片段。
 
+    Returns:
+        Tuple[str, str] | None: `(image_format, image_base64)`；无法解析时返回 `None`。
+    """
+    return _normalize_image_base64_for_openai(part.normalized_image_format, part.image_base64)
+
+
+def _normalize_image_base64_for_openai(fallback_format: str, image_base64: str) -> Tuple[str, str] | None:
+    """规范化 Base64 图片数据，并复用同一张图片的规范化结果。
+
+    同一张图片在多次模型尝试之间会被重复构建请求，因此按图片内容摘要缓存规范化结果，
+    避免每次重试都重新解码与转码。缓存不持有原图数据，无法解析的图片也不会被缓存。
+
+    Args:
+        fallback_format: 无法从图片内容识别格式时使用的规范化格式。
+        image_base64: 图片的 Base64 编码。
+
+    Returns:
+        Tuple[str, str] | None: `(image_format, image_base64)`；无法解析时返回 `None`。
+    """
+    cache_key = (fallback_format, hashlib.sha256(image_base64.encode("utf-8")).digest())
+    with _normalized_image_cache_lock:
+        cached_image = _normalized_image_cache.get(cache_key)
+        if cached_image is not None:
+            _normalized_image_cache.move_to_end(cache_key)
+    if cached_image is not None:
+        image_format, converted_base64 = cached_image
+        return image_format, converted_base64 if converted_base64 is not None else image_base64
+
+    normalized_image = _decode_and_normalize_image_base64(fallback_format, image_base64)
+    if normalized_image is None:
+        return None
+
+    image_format, normalized_base64 = normalized_image
+    # 原样可用的图片只缓存格式，避免缓存长期持有原图数据
+    converted_base64 = None if normalized_base64 is image_base64 else normalized_base64
+    with _normalized_image_cache_lock:
+        _normalized_image_cache[cache_key] = (image_format, converted_base64)
+        _normalized_image_cache.move_to_end(cache_key)
+        while len(_normalized_image_cache) > NORMALIZED_IMAGE_CACHE_SIZE:
+            _normalized_image_cache.popitem(last=False)
+    return normalized_image
+
+
+def _decode_and_normalize_image_base64(fallback_format: str, image_base64: str) -> Tuple[str, str] | None:
+    """解码并规范化 Base64 图片数据。
+
+    Args:
+        fallback_format: 无法从图片内容识别格式时使用的规范化格式。
+        image_base64: 图片的 Base64 编码。
+
     Returns:
         Tuple[str, str] | None: `(image_format, image_base64)`；无法解析时返回 `None`。
     """
     try:
-        image_bytes = base64.b64decode(part.image_base64, validate=True)
+        image_bytes = base64.b64decode(image_base64, validate=True)
     except (binascii.Error, ValueError) as exc:
         logger.warning(f"图片 Base64 解码失败，已跳过该图片片段: {exc}")
         return None
 
     try:
         with PILImage.open(io.BytesIO(image_bytes)) as image:
-            image_format = (image.format or part.normalized_image_format).lower()
+            image_format = (image.format or fallback_format).lower()
             if image_format in {"jpg", "jpeg"}:
                 image_format = "jpeg"
 
             if image_format in SUPPORTED_OPENAI_IMAGE_FORMATS:
-                return image_format, part.image_base64
+                return image_format, image_base64
 
             if image_format == "gif":
                 frame_count = getattr(image, "n_frames", 1)
@@ -401,14 +482,7 @@ def _convert_user_message_content(message: Message) -> str | List[ChatCompletion
             continue
 
         image_format, image_base64 = normalized_image
-        content.append(
-            {
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/{image_format};base64,{image_base64}",
-                },
-            }
-        )
+        content.append(_build_image_url_content_part(image_format, image_base64))
     if not content:
         return ""
     return content
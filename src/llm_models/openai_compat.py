@@ -99,6 +99,10 @@ def build_openai_compatible_client_config(api_provider: APIProvider) -> OpenAICo
     )
 
 
+_REQUEST_OVERRIDE_SECTION_KEYS = frozenset({"headers", "query", "body"})
+"""`extra_params` 中分别承载请求头、查询参数和请求体扩展字段的键。"""
+
+
 def _extract_mapping(value: Any) -> dict[str, Any]:
     """将任意映射值规范化为普通字典。
 
@@ -127,14 +131,15 @@ def split_openai_request_overrides(
     Returns:
         OpenAICompatibleRequestOverrides: 拆分后的请求覆盖配置。
     """
-    raw_params = dict(extra_params or {})
-    extra_headers = _extract_mapping(raw_params.pop("headers", None))
-    extra_query = _extract_mapping(raw_params.pop("query", None))
-    extra_body = _extract_mapping(raw_params.pop("body", None))
+    # 直接读取原映射而不是先整体复制再 pop，输出的各部分本身都是新字典，不会回写调用方的参数
+    raw_params = extra_params or {}
+    extra_headers = _extract_mapping(raw_params.get("headers"))
+    extra_query = _extract_mapping(raw_params.get("query"))
+    extra_body = _extract_mapping(raw_params.get("body"))
     blocked_body_keys = reserved_body_keys or set()
 
     for key, value in raw_params.items():
-        if key in blocked_body_keys:
+        if key in _REQUEST_OVERRIDE_SECTION_KEYS or key in blocked_body_keys:
             continue
         extra_body[key] = value
 
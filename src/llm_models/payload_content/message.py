@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Tuple
+from typing import Collection, FrozenSet, List, Tuple
 
 from .tool_option import ToolCall
 
@@ -14,8 +14,8 @@ class RoleType(str, Enum):
     Tool = "tool"
 
 
-SUPPORTED_IMAGE_FORMATS = ["jpg", "jpeg", "png", "webp", "gif"]
-"""默认支持的图片格式列表。"""
+SUPPORTED_IMAGE_FORMATS: FrozenSet[str] = frozenset({"jpg", "jpeg", "png", "webp", "gif"})
+"""默认支持的图片格式集合。"""
 
 
 @dataclass(slots=True)
@@ -179,14 +179,14 @@ class MessageBuilder:
         self,
         image_format: str,
         image_base64: str,
-        support_formats: List[str] = SUPPORTED_IMAGE_FORMATS,
+        support_formats: Collection[str] = SUPPORTED_IMAGE_FORMATS,
     ) -> "MessageBuilder":
         """追加 Base64 图片片段。
 
         Args:
             image_format: 图片格式。
             image_base64: 图片的 Base64 编码。
-            support_formats: 允许的图片格式列表。
+            support_formats: 允许的图片格式集合。
 
         Returns:
             MessageBuilder: 当前构建器实例。
@@ -203,14 +203,14 @@ class MessageBuilder:
         self,
         image_format: str,
         image_base64: str,
-        support_formats: List[str] = SUPPORTED_IMAGE_FORMATS,
+        support_formats: Collection[str] = SUPPORTED_IMAGE_FORMATS,
     ) -> "MessageBuilder":
         """追加 Base64 图片片段。
 
         Args:
             image_format: 图片格式。
             image_base64: 图片的 Base64 编码。
-            support_formats: 允许的图片格式列表。
+            support_formats: 允许的图片格式集合。
 
         Returns:
             MessageBuilder: 当前构建器实例。
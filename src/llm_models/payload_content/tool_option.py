@@ -19,6 +19,18 @@ class ToolParamType(str, Enum):
 LegacyToolParameterTuple = Tuple[str, ToolParamType, str, bool, List[str] | None]
 """旧版工具参数元组格式。"""
 
+TOOL_PARAM_TYPE_ALIASES: Dict[str, ToolParamType] = {
+    "integer": ToolParamType.INTEGER,
+    "int": ToolParamType.INTEGER,
+    "number": ToolParamType.NUMBER,
+    "float": ToolParamType.NUMBER,
+    "boolean": ToolParamType.BOOLEAN,
+    "bool": ToolParamType.BOOLEAN,
+    "array": ToolParamType.ARRAY,
+    "object": ToolParamType.OBJECT,
+}
+"""规范化后的参数类型名称到内部参数类型的映射，未收录的名称视为 `STRING`。"""
+
 
 def normalize_tool_param_type(raw_value: ToolParamType | str | None) -> ToolParamType:
     """将任意输入值规范化为内部工具参数类型。
@@ -33,17 +45,7 @@ def normalize_tool_param_type(raw_value: ToolParamType | str | None) -> ToolPara
         return raw_value
 
     normalized_value = str(raw_value or "").strip().lower()
-    if normalized_value in {"integer", "int"}:
-        return ToolParamType.INTEGER
-    if normalized_value in {"number", "float"}:
-        return ToolParamType.NUMBER
-    if normalized_value in {"boolean", "bool"}:
-        return ToolParamType.BOOLEAN
-    if normalized_value == "array":
-        return ToolParamType.ARRAY
-    if normalized_value == "object":
-        return ToolParamType.OBJECT
-    return ToolParamType.STRING
+    return TOOL_PARAM_TYPE_ALIASES.get(normalized_value, ToolParamType.STRING)
 
 
 def _is_object_schema(schema: Dict[str, Any]) -> bool:
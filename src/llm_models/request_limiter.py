@@ -0,0 +1,198 @@
+"""按 API 提供商限制请求并发数与请求速率。
+
+嵌入请求可能运行在同步调用创建的临时事件循环中，因此限制器不绑定事件循环：
+内部状态由线程锁保护，等待方在各自的事件循环中挂起，由释放方跨线程唤醒，
+保证同一提供商的限制在整个进程内生效。
+"""
+
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, Tuple
+
+import asyncio
+import threading
+import time
+
+from src.config.model_configs import APIProvider
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    """令牌桶速率限制器，可在多个线程与事件循环间共享。"""
+
+    rate_per_second: float
+    """每秒补充的令牌数。"""
+
+    capacity: float
+    """桶容量，即允许的最大突发请求数。"""
+
+    tokens: float = field(init=False)
+    """当前可用令牌数，为负数时表示已被预约的令牌数。"""
+
+    updated_at: float = field(default_factory=time.monotonic)
+    """上次补充令牌的单调时钟时间戳。"""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    """保护令牌状态的线程锁。"""
+
+    def __post_init__(self) -> None:
+        """初始化时装满令牌桶。"""
+        self.tokens = self.capacity
+
+    async def acquire(self) -> None:
+        """预约一个令牌，令牌不足时等待到预约的令牌补充完成。"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+            self.updated_at = now
+            self.tokens -= 1
+            wait_seconds = -self.tokens / self.rate_per_second if self.tokens < 0 else 0.0
+
+        if wait_seconds <= 0:
+            return
+        try:
+            await asyncio.sleep(wait_seconds)
+        except asyncio.CancelledError:
+            # 取消等待时归还预约的令牌，避免后续请求被多等一轮
+            with self._lock:
+                self.tokens += 1
+            raise
+
+
+@dataclass(slots=True)
+class ConcurrencyLimiter:
+    """并发名额限制器，可在多个线程与事件循环间共享。"""
+
+    max_concurrency: int
+    """最大并发数。"""
+
+    active_count: int = field(default=0, init=False)
+    """当前已占用的名额数。"""
+
+    _waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = field(
+        default_factory=deque, init=False, repr=False
+    )
+    """按到达顺序排队的等待者：(所在事件循环, 唤醒用 Future)。"""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    """保护名额与等待队列的线程锁。"""
+
+    async def acquire(self) -> None:
+        """占用一个名额，名额用尽时排队等待。"""
+        with self._lock:
+            if self.active_count < self.max_concurrency and not self._waiters:
+                self.active_count += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter: "asyncio.Future[None]" = loop.create_future()
+            waiter_entry = (loop, waiter)
+            self._waiters.append(waiter_entry)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter_entry in self._waiters:
+                    self._waiters.remove(waiter_entry)
+                    raise
+            # 取消前名额已经转交给当前等待者，需要归还
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """释放一个名额；有等待者时直接把名额转交给最早的等待者。"""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if loop.is_closed():
+                    continue
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+                return
+            self.active_count -= 1
+
+
+def _wake_waiter(waiter: "asyncio.Future[None]") -> None:
+    """在等待者所属事件循环中唤醒等待者。"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+@dataclass(slots=True)
+class ProviderRequestLimiter:
+    """单个 API 提供商的请求限制器。"""
+
+    max_concurrency: int
+    """最大并发请求数，0 表示不限制。"""
+
+    requests_per_minute: int
+    """每分钟最大请求数，0 表示不限制。"""
+
+    concurrency_limiter: ConcurrencyLimiter | None = field(init=False)
+    """并发限制器。"""
+
+    token_bucket: TokenBucket | None = field(init=False)
+    """速率限制令牌桶。"""
+
+    def __post_init__(self) -> None:
+        """按配置创建并发与速率限制组件。"""
+        self.concurrency_limiter = ConcurrencyLimiter(self.max_concurrency) if self.max_concurrency > 0 else None
+        if self.requests_per_minute > 0:
+            rate_per_second = self.requests_per_minute / 60
+            self.token_bucket = TokenBucket(rate_per_second=rate_per_second, capacity=max(1.0, rate_per_second))
+        else:
+            self.token_bucket = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """占用一个请求名额，退出上下文时释放并发名额。"""
+        if self.concurrency_limiter is None:
+            if self.token_bucket is not None:
+                await self.token_bucket.acquire()
+            yield
+            return
+
+        await self.concurrency_limiter.acquire()
+        try:
+            if self.token_bucket is not None:
+                await self.token_bucket.acquire()
+            yield
+        finally:
+            self.concurrency_limiter.release()
+
+
+_provider_limiters: Dict[str, ProviderRequestLimiter] = {}
+"""APIProvider.name -> 限制器 的映射表"""
+
+_provider_limiters_lock = threading.Lock()
+"""保护限制器映射表的线程锁。"""
+
+
+def get_provider_request_limiter(api_provider: APIProvider) -> ProviderRequestLimiter | None:
+    """获取指定提供商在整个进程内共享的请求限制器。
+
+    配置热重载修改限制值后会重新创建限制器，已在旧限制器中的请求按旧限制执行完毕。
+
+    Args:
+        api_provider: API 提供商配置。
+
+    Returns:
+        ProviderRequestLimiter | None: 未配置任何限制时返回 ``None``。
+    """
+    with _provider_limiters_lock:
+        if api_provider.max_concurrency <= 0 and api_provider.requests_per_minute <= 0:
+            _provider_limiters.pop(api_provider.name, None)
+            return None
+
+        limiter = _provider_limiters.get(api_provider.name)
+        if (
+            limiter is None
+            or limiter.max_concurrency != api_provider.max_concurrency
+            or limiter.requests_per_minute != api_provider.requests_per_minute
+        ):
+            limiter = ProviderRequestLimiter(
+                max_concurrency=api_provider.max_concurrency,
+                requests_per_minute=api_provider.requests_per_minute,
+            )
+            _provider_limiters[api_provider.name] = limiter
+        return limiter
@@ -1,12 +1,13 @@
 from datetime import datetime
-import base64
-import io
+from typing import Iterator
 
-from PIL import Image
+import asyncio
+import base64
 
 from src.common.database.database import get_db_session
 from src.common.database.database_model import ModelUsage, ModelUser
 from src.common.logger import get_logger
+from src.common.runtime_loop import get_main_loop
 from src.config.model_configs import ModelInfo
 
 from .model_client.base_client import UsageRecord
@@ -14,6 +15,12 @@ from .payload_content.message import ImageMessagePart, Message, MessageBuilder,
 
 logger = get_logger("消息压缩工具")
 
+USAGE_FLUSH_INTERVAL_SECONDS = 5.0
+"""使用记录在主事件循环中攒批写入的最长等待时间（秒）"""
+
+USAGE_FLUSH_BATCH_SIZE = 32
+"""缓冲的使用记录达到该数量时立即写入"""
+
 
 def compress_messages(messages: list[Message], img_target_size: int = 1 * 1024 * 1024) -> list[Message]:
     """
@@ -22,6 +29,10 @@ def compress_messages(messages: list[Message], img_target_size: int = 1 * 1024 *
     :param img_target_size: 图片目标大小，默认1MB
     :return: 压缩后的消息列表
     """
+    # 仅在需要压缩图片时才加载 Pillow，避免拖慢模块导入
+    from PIL import Image
+
+    import io
 
     def reformat_static_image(image_data: bytes) -> bytes:
         """
@@ -67,31 +78,39 @@ def compress_messages(messages: list[Message], img_target_size: int = 1 * 1024 *
             new_w = max(1, int(original_size[0] * scale))
             new_h = max(1, int(original_size[1] * scale))
             new_size = (new_w, new_h)
+            is_animated = getattr(image, "is_animated", False)
+            if is_animated:
+                new_size = (max(1, new_size[0] // 2), max(1, new_size[1] // 2))  # 动图，缩放尺寸再打折
+            if new_size == original_size:
+                # 尺寸未变化（如 1 像素宽高的图片）时，重采样与重新编码都不会带来收益
+                return image_data, original_size, new_size
 
             output_buffer = io.BytesIO()
 
-            if getattr(image, "is_animated", False):
+            if is_animated:
                 # 动态图片，处理所有帧
-                frames = []
-                new_size = (max(1, new_size[0] // 2), max(1, new_size[1] // 2))  # 动图，缩放尺寸再打折
-                for frame_idx in range(getattr(image, "n_frames", 1)):
-                    image.seek(frame_idx)
-                    new_frame = image.copy()
-                    new_frame = new_frame.resize(new_size, Image.Resampling.LANCZOS)
-                    frames.append(new_frame)
+                def iter_resized_frames(start_index: int) -> Iterator[Image.Image]:
+                    """按需逐帧缩放，resize 本身返回新图像，无需先复制帧"""
+                    for frame_idx in range(start_index, getattr(image, "n_frames", 1)):
+                        image.seek(frame_idx)
+                        yield image.resize(new_size, Image.Resampling.LANCZOS)
+
+                first_frame = next(iter_resized_frames(0))
 
                 # 保存到缓冲区
-                frames[0].save(
+                first_frame.save(
                     output_buffer,
                     format="GIF",
                     save_all=True,
-                    append_images=frames[1:],
+                    append_images=iter_resized_frames(1),
                     optimize=True,
                     duration=image.info.get("duration", 100),
                     loop=image.info.get("loop", 0),
                 )
             else:
-                # 静态图片，直接缩放保存
+                # 静态图片，直接缩放保存；JPEG 可先让解码器按 1/2、1/4、1/8 预缩小，减少参与重采样的像素
+                if image.format == "JPEG":
+                    image.draft(image.mode, new_size)
                 resized_image = image.resize(new_size, Image.Resampling.LANCZOS)
                 if resized_image.mode in ("RGBA", "LA", "P"):
                     resized_image = resized_image.convert("RGB")
@@ -109,11 +128,12 @@ def compress_messages(messages: list[Message], img_target_size: int = 1 * 1024 *
     def compress_base64_image(base64_data: str, target_size: int = 1 * 1024 * 1024) -> str:
         original_b64_data_size = len(base64_data)  # 计算原始数据大小
 
-        image_data = base64.b64decode(base64_data)
+        original_image_data = base64.b64decode(base64_data)
 
-        # 先尝试转换格式为JPEG
-        image_data = reformat_static_image(image_data)
-        base64_data = base64.b64encode(image_data).decode("utf-8")
+        # 先尝试转换格式为JPEG；未发生转换时沿用原始编码，避免重复编码
+        image_data = reformat_static_image(original_image_data)
+        if image_data is not original_image_data:
+            base64_data = base64.b64encode(image_data).decode("utf-8")
         if len(base64_data) <= target_size:
             # 如果转换后小于目标大小，直接返回
             logger.info(f"成功将图片转为JPEG格式，编码后大小: {len(base64_data) / 1024:.1f}KB")
@@ -121,8 +141,9 @@ def compress_messages(messages: list[Message], img_target_size: int = 1 * 1024 *
 
         # 如果转换后仍然大于目标大小，进行尺寸压缩
         scale = min(1.0, target_size / len(base64_data))
-        image_data, original_size, new_size = rescale_image(image_data, scale)
-        base64_data = base64.b64encode(image_data).decode("utf-8")
+        rescaled_image_data, original_size, new_size = rescale_image(image_data, scale)
+        if rescaled_image_data is not image_data:
+            base64_data = base64.b64encode(rescaled_image_data).decode("utf-8")
 
         if original_size and new_size:
             logger.info(
@@ -166,7 +187,9 @@ class LLMUsageRecorder:
     """
 
     def __init__(self):
-        pass
+        self._pending_records: list[ModelUsage] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_wakeup: asyncio.Event | None = None
 
     @staticmethod
     def _calculate_input_cost(model_info: ModelInfo, model_usage: UsageRecord) -> float:
@@ -187,7 +210,7 @@ class LLMUsageRecorder:
         uncached_cost = (cache_miss_tokens / 1000000) * model_info.price_in
         return cached_cost + uncached_cost
 
-    def record_usage_to_database(
+    def _build_usage_record(
         self,
         model_info: ModelInfo,
         model_usage: UsageRecord,
@@ -196,39 +219,129 @@ class LLMUsageRecorder:
         endpoint: str,
         task_name: str | None = None,
         time_cost: float = 0.0,
-    ):
-        input_cost = self._calculate_input_cost(model_info, model_usage)
-        output_cost = (model_usage.completion_tokens / 1000000) * model_info.price_out
-        total_cost = round(input_cost + output_cost, 6)
+    ) -> ModelUsage:
+        """根据一次请求的用量构建待写入的使用记录。"""
+        if model_info.price_in or model_info.price_out or (model_info.cache and model_info.cache_price_in):
+            input_cost = self._calculate_input_cost(model_info, model_usage)
+            output_cost = (model_usage.completion_tokens / 1000000) * model_info.price_out
+            total_cost = round(input_cost + output_cost, 6)
+        else:
+            # 未配置价格的免费或自部署模型无需计算费用
+            total_cost = 0.0
+        logger.debug(
+            f"Token使用情况 - 模型: {model_usage.model_name}, "
+            f"用户: {user_id}, 类型: {request_type}, "
+            f"提示词: {model_usage.prompt_tokens}, 完成: {model_usage.completion_tokens}, "
+            f"总计: {model_usage.total_tokens}"
+        )
+        return ModelUsage(
+            model_name=model_info.model_identifier,
+            model_assign_name=model_info.name,
+            model_api_provider_name=model_info.api_provider,
+            endpoint=endpoint,
+            user_type=ModelUser.SYSTEM,
+            task_name=task_name,
+            request_type=request_type,
+            time_cost=round(time_cost or 0.0, 3),
+            timestamp=datetime.now(),
+            prompt_tokens=model_usage.prompt_tokens or 0,
+            completion_tokens=model_usage.completion_tokens or 0,
+            total_tokens=model_usage.total_tokens or 0,
+            prompt_cache_enabled=bool(model_info.cache),
+            prompt_cache_hit_tokens=model_usage.prompt_cache_hit_tokens or 0,
+            prompt_cache_miss_tokens=model_usage.prompt_cache_miss_tokens or 0,
+            cost=total_cost or 0.0,
+        )
+
+    @staticmethod
+    def _persist_usage_records(records: list[ModelUsage]) -> None:
+        """在一个事务中写入一批使用记录。"""
         try:
             with get_db_session() as session:
-                record = ModelUsage(
-                    model_name=model_info.model_identifier,
-                    model_assign_name=model_info.name,
-                    model_api_provider_name=model_info.api_provider,
-                    endpoint=endpoint,
-                    user_type=ModelUser.SYSTEM,
-                    task_name=task_name,
-                    request_type=request_type,
-                    time_cost=round(time_cost or 0.0, 3),
-                    timestamp=datetime.now(),
-                    prompt_tokens=model_usage.prompt_tokens or 0,
-                    completion_tokens=model_usage.completion_tokens or 0,
-                    total_tokens=model_usage.total_tokens or 0,
-                    prompt_cache_enabled=bool(model_info.cache),
-                    prompt_cache_hit_tokens=model_usage.prompt_cache_hit_tokens or 0,
-                    prompt_cache_miss_tokens=model_usage.prompt_cache_miss_tokens or 0,
-                    cost=total_cost or 0.0,
-                )
-                session.add(record)
-            logger.debug(
-                f"Token使用情况 - 模型: {model_usage.model_name}, "
-                f"用户: {user_id}, 类型: {request_type}, "
-                f"提示词: {model_usage.prompt_tokens}, 完成: {model_usage.completion_tokens}, "
-                f"总计: {model_usage.total_tokens}"
-            )
+                session.add_all(records)
         except Exception as e:
             logger.error(f"记录token使用情况失败: {str(e)}")
 
+    def record_usage_to_database(
+        self,
+        model_info: ModelInfo,
+        model_usage: UsageRecord,
+        user_id: str,
+        request_type: str,
+        endpoint: str,
+        task_name: str | None = None,
+        time_cost: float = 0.0,
+    ):
+        record = self._build_usage_record(
+            model_info=model_info,
+            model_usage=model_usage,
+            user_id=user_id,
+            request_type=request_type,
+            endpoint=endpoint,
+            task_name=task_name,
+            time_cost=time_cost,
+        )
+        self._persist_usage_records([record])
+
+    async def _flush_pending_records(self) -> None:
+        """持续写出待写入的使用记录，直到队列清空。"""
+        while self._pending_records:
+            records = self._pending_records
+            self._pending_records = []
+            await asyncio.to_thread(self._persist_usage_records, records)
+
+    async def _flush_after_delay(self, wakeup: asyncio.Event) -> None:
+        """等待攒批时间到期或缓冲达到批量阈值后写出使用记录。"""
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=USAGE_FLUSH_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        await self._flush_pending_records()
+
+    async def flush(self) -> None:
+        """立即写出缓冲区中的全部使用记录，供主事件循环中的关闭流程调用。"""
+        if self._flush_wakeup is not None:
+            self._flush_wakeup.set()
+        if self._flush_task is not None and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
+        await self._flush_pending_records()
+
+    async def record_usage(
+        self,
+        model_info: ModelInfo,
+        model_usage: UsageRecord,
+        user_id: str,
+        request_type: str,
+        endpoint: str,
+        task_name: str | None = None,
+        time_cost: float = 0.0,
+    ) -> None:
+        """在工作线程中写入使用记录，避免同步的 SQLite 提交阻塞事件循环。
+
+        主事件循环中的记录先进入缓冲区，每隔 ``USAGE_FLUSH_INTERVAL_SECONDS`` 秒或攒满
+        ``USAGE_FLUSH_BATCH_SIZE`` 条时由后台任务合并为一个事务写入，请求无需等待落库；
+        关闭时需调用 ``flush`` 写出剩余记录。缓冲区与后台任务只在主事件循环中访问，
+        其他线程中的事件循环（如同步调用使用的临时循环）可能随时关闭，直接单独写入并等待完成。
+        """
+        record = self._build_usage_record(
+            model_info=model_info,
+            model_usage=model_usage,
+            user_id=user_id,
+            request_type=request_type,
+            endpoint=endpoint,
+            task_name=task_name,
+            time_cost=time_cost,
+        )
+        if get_main_loop() is not asyncio.get_running_loop():
+            await asyncio.to_thread(self._persist_usage_records, [record])
+            return
+
+        self._pending_records.append(record)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_wakeup = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_after_delay(self._flush_wakeup))
+        if len(self._pending_records) >= USAGE_FLUSH_BATCH_SIZE and self._flush_wakeup is not None:
+            self._flush_wakeup.set()
+
 
 llm_usage_recorder = LLMUsageRecorder()
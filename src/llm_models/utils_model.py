@@ -4,13 +4,12 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import asyncio
 import inspect
+import logging
 import random
 import re
 import time
 import traceback
 
-from rich.traceback import install
-
 from src.common.logger import get_logger
 from src.common.data_models.llm_service_data_models import (
     LLMAudioTranscriptionResult,
@@ -39,6 +38,7 @@ from src.llm_models.model_client.base_client import (
     UsageRecord,
     client_registry,
 )
+from src.llm_models.request_limiter import get_provider_request_limiter
 from src.llm_models.request_snapshot import format_request_snapshot_log_info
 from src.llm_models.payload_content.message import Message, MessageBuilder
 from src.llm_models.payload_content.resp_format import RespFormat
@@ -50,8 +50,6 @@ from src.llm_models.payload_content.tool_option import (
 )
 from src.llm_models.utils import compress_messages, llm_usage_recorder
 
-install(extra_lines=3)
-
 logger = get_logger("model_utils")
 
 DATA_URI_LIMIT_PATTERN = re.compile(
@@ -100,6 +98,8 @@ class LLMOrchestrator:
             model: (0, 0, 0) for model in self.model_for_task.model_list
         }
         """模型使用量记录，用于进行负载均衡，对应为(total_tokens, penalty, usage_penalty)，惩罚值是为了能在某个模型请求不给力或正在被使用的时候进行调整"""
+        self._inflight_embeddings: Dict[str, asyncio.Task[LLMEmbeddingResult]] = {}
+        """进行中的嵌入请求，相同文本的并发请求共享同一次模型调用"""
 
     def _get_task_config_or_raise(self) -> TaskConfig:
         """获取当前任务名对应的最新任务配置。
@@ -249,16 +249,22 @@ class LLMOrchestrator:
         Returns:
             LLMResponseResult: 统一文本响应结果对象。
         """
-        self._refresh_task_config()
         start_time = time.time()
+        built_messages: List[Message] = []
 
         def message_factory(client: BaseClient) -> List[Message]:
+            # 图文消息在各次模型尝试间内容不变，只需按当前客户端重新校验图片格式
+            if built_messages:
+                if image_format.lower() not in client.get_support_image_formats():
+                    raise ValueError("不受支持的图片格式")
+                return list(built_messages)
             message_builder = MessageBuilder()
             message_builder.add_text_content(prompt)
             message_builder.add_image_content(
                 image_base64=image_base64, image_format=image_format, support_formats=client.get_support_image_formats()
             )
-            return [message_builder.build()]
+            built_messages.append(message_builder.build())
+            return list(built_messages)
 
         execution_result = await self._execute_request(
             request_type=RequestType.RESPONSE,
@@ -278,7 +284,7 @@ class LLMOrchestrator:
         time_cost = time.time() - start_time
         self._check_slow_request(time_cost, model_info.name)
         if usage := response.usage:
-            llm_usage_recorder.record_usage_to_database(
+            await llm_usage_recorder.record_usage(
                 model_info=model_info,
                 model_usage=usage,
                 user_id="system",
@@ -304,7 +310,6 @@ class LLMOrchestrator:
         Returns:
             LLMAudioTranscriptionResult: 语音转写结果对象。
         """
-        self._refresh_task_config()
         execution_result = await self._execute_request(
             request_type=RequestType.AUDIO,
             audio_base64=voice_base64,
@@ -337,13 +342,13 @@ class LLMOrchestrator:
             LLMResponseResult: 统一文本响应结果对象。
         """
         del raise_when_empty
-        self._refresh_task_config()
         start_time = time.time()
 
+        # 纯文本消息与客户端无关，只构建一次，各次模型尝试与重试直接复用
+        prompt_message = MessageBuilder().add_text_content(prompt).build()
+
         def message_factory(client: BaseClient) -> List[Message]:
-            message_builder = MessageBuilder()
-            message_builder.add_text_content(prompt)
-            return [message_builder.build()]
+            return [prompt_message]
 
         tool_built = self._build_tool_options(tools)
 
@@ -360,8 +365,10 @@ class LLMOrchestrator:
         response = execution_result.api_response
         model_info = execution_result.model_info
 
-        logger.debug(f"LLM请求总耗时: {time.time() - start_time}")
-        logger.debug(f"LLM生成内容: {response}")
+        # structlog 的处理器链在级别过滤之前执行，调试日志关闭时也要先判断，避免格式化整个响应对象
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"LLM请求总耗时: {time.time() - start_time}")
+            logger.debug(f"LLM生成内容: {response}")
 
         content = response.content
         reasoning_content = response.reasoning_content or ""
@@ -370,7 +377,7 @@ class LLMOrchestrator:
             content, extracted_reasoning = self._extract_reasoning(content)
             reasoning_content = extracted_reasoning
         if usage := response.usage:
-            llm_usage_recorder.record_usage_to_database(
+            await llm_usage_recorder.record_usage(
                 model_info=model_info,
                 model_usage=usage,
                 user_id="system",
@@ -413,7 +420,6 @@ class LLMOrchestrator:
             LLMResponseResult: 统一文本响应结果对象。
         """
         del raise_when_empty
-        self._refresh_task_config()
         start_time = time.time()
 
         tool_built = self._build_tool_options(tools)
@@ -432,8 +438,9 @@ class LLMOrchestrator:
         model_info = execution_result.model_info
 
         time_cost = time.time() - start_time
-        logger.debug(f"LLM请求总耗时: {time_cost}")
-        logger.debug(f"LLM生成内容: {response}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"LLM请求总耗时: {time_cost}")
+            logger.debug(f"LLM生成内容: {response}")
 
         content = response.content
         reasoning_content = response.reasoning_content or ""
@@ -443,7 +450,7 @@ class LLMOrchestrator:
             reasoning_content = extracted_reasoning
         self._check_slow_request(time_cost, model_info.name)
         if usage := response.usage:
-            llm_usage_recorder.record_usage_to_database(
+            await llm_usage_recorder.record_usage(
                 model_info=model_info,
                 model_usage=usage,
                 user_id="system",
@@ -463,13 +470,49 @@ class LLMOrchestrator:
     async def get_embedding(self, embedding_input: str) -> LLMEmbeddingResult:
         """获取嵌入向量。
 
+        同一文本的并发请求会合并为一次模型调用，各调用方共享结果。
+
+        Args:
+            embedding_input: 待编码的文本。
+
+        Returns:
+            LLMEmbeddingResult: 向量生成结果对象。
+        """
+        embedding_task = self._inflight_embeddings.get(embedding_input)
+        if embedding_task is None or embedding_task.get_loop() is not asyncio.get_running_loop():
+            embedding_task = asyncio.create_task(self._request_embedding(embedding_input))
+            self._inflight_embeddings[embedding_input] = embedding_task
+            embedding_task.add_done_callback(
+                lambda done_task: self._release_inflight_embedding(embedding_input, done_task)
+            )
+        return await asyncio.shield(embedding_task)
+
+    def _release_inflight_embedding(
+        self,
+        embedding_input: str,
+        embedding_task: asyncio.Task[LLMEmbeddingResult],
+    ) -> None:
+        """在嵌入请求结束后移除进行中记录。
+
+        Args:
+            embedding_input: 待编码的文本。
+            embedding_task: 已结束的嵌入请求任务。
+        """
+        if self._inflight_embeddings.get(embedding_input) is embedding_task:
+            del self._inflight_embeddings[embedding_input]
+        if not embedding_task.cancelled():
+            # 调用方均已取消时也要取走异常，避免事件循环报告未处理的任务异常
+            embedding_task.exception()
+
+    async def _request_embedding(self, embedding_input: str) -> LLMEmbeddingResult:
+        """执行一次嵌入模型调用并记录用量。
+
         Args:
             embedding_input: 待编码的文本。
 
         Returns:
             LLMEmbeddingResult: 向量生成结果对象。
         """
-        self._refresh_task_config()
         start_time = time.time()
         execution_result = await self._execute_request(
             request_type=RequestType.EMBEDDING,
@@ -479,7 +522,7 @@ class LLMOrchestrator:
         model_info = execution_result.model_info
         embedding = response.embedding
         if usage := response.usage:
-            llm_usage_recorder.record_usage_to_database(
+            await llm_usage_recorder.record_usage(
                 model_info=model_info,
                 model_usage=usage,
                 user_id="system",
@@ -696,7 +739,6 @@ class LLMOrchestrator:
         Returns:
             Tuple[ModelInfo, APIProvider, BaseClient]: 选中的模型、提供商与客户端实例。
         """
-        self._refresh_task_config()
         available_models = {
             model: scores
             for model, scores in self.model_usage.items()
@@ -728,29 +770,56 @@ class LLMOrchestrator:
             selected_model_name = next(
                 model_name for model_name in self.model_for_task.model_list if model_name in available_models
             )
-        elif strategy == "balance":
-            # 负载均衡策略：根据总tokens和惩罚值选择
-            selected_model_name = min(
-                available_models,
-                key=lambda k: available_models[k][0] + available_models[k][1] * 300 + available_models[k][2] * 1000,
-            )
         else:
-            # 默认使用负载均衡策略
-            logger.warning(f"未知的选择策略 '{strategy}'，使用默认的负载均衡策略")
-            selected_model_name = min(
-                available_models,
-                key=lambda k: available_models[k][0] + available_models[k][1] * 300 + available_models[k][2] * 1000,
-            )
+            if strategy != "balance":
+                # 默认使用负载均衡策略
+                logger.warning(f"未知的选择策略 '{strategy}'，使用默认的负载均衡策略")
+            # 负载均衡策略：根据总tokens和惩罚值选择
+            selected_model_name = min(available_models.items(), key=self._balance_score)[0]
 
         model_info = TempMethodsLLMUtils.get_model_info_by_name(selected_model_name)
         api_provider = TempMethodsLLMUtils.get_provider_by_name(model_info.api_provider)
-        force_new_client = self.request_type == "embedding"
-        client = client_registry.get_client_class_instance(api_provider, force_new=force_new_client)
-        logger.debug(f"选择请求模型: {model_info.name} (策略: {strategy})")
+        if self.request_type == "embedding":
+            # 嵌入请求可能运行在临时事件循环中，只复用同一事件循环内创建的客户端连接池
+            client = client_registry.get_loop_bound_client_instance(api_provider)
+        else:
+            client = client_registry.get_client_class_instance(api_provider)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"选择请求模型: {model_info.name} (策略: {strategy})")
         total_tokens, penalty, usage_penalty = self.model_usage[model_info.name]
         self.model_usage[model_info.name] = (total_tokens, penalty, usage_penalty + 1)
         return model_info, api_provider, client
 
+    @staticmethod
+    def _balance_score(model_usage_item: Tuple[str, Tuple[int, int, int]]) -> int:
+        """计算负载均衡策略下模型的选择得分。
+
+        Args:
+            model_usage_item: `(模型名称, (总 tokens, 惩罚值, 使用惩罚值))` 二元组。
+
+        Returns:
+            int: 选择得分，越低越优先。
+        """
+        total_tokens, penalty, usage_penalty = model_usage_item[1]
+        return total_tokens + penalty * 300 + usage_penalty * 1000
+
+    @staticmethod
+    async def _send_client_request(client: BaseClient, request: ClientRequest) -> APIResponse:
+        """按请求类型调用客户端接口。
+
+        Args:
+            client: 已初始化的客户端实例。
+            request: 统一客户端请求对象。
+
+        Returns:
+            APIResponse: 统一响应对象。
+        """
+        if isinstance(request, ResponseRequest):
+            return await client.get_response(request)
+        if isinstance(request, EmbeddingRequest):
+            return await client.get_embedding(request)
+        return await client.get_audio_transcriptions(request)
+
     async def _attempt_request_on_model(
         self,
         api_provider: APIProvider,
@@ -778,13 +847,15 @@ class LLMOrchestrator:
         original_response_request = request if isinstance(request, ResponseRequest) else None
         active_request: ClientRequest = request
 
+        request_limiter = get_provider_request_limiter(api_provider)
+
         while retry_remain > 0:
             try:
-                if isinstance(active_request, ResponseRequest):
-                    return await client.get_response(active_request)
-                if isinstance(active_request, EmbeddingRequest):
-                    return await client.get_embedding(active_request)
-                return await client.get_audio_transcriptions(active_request)
+                if request_limiter is None:
+                    return await self._send_client_request(client, active_request)
+                # 重试等待发生在名额释放之后，避免失败请求占住提供商的并发名额
+                async with request_limiter.slot():
+                    return await self._send_client_request(client, active_request)
             except EmptyResponseException as e:
                 # 空回复：通常为临时问题，单独记录并重试
                 original_error_info = self._get_original_error_info(e)
@@ -827,11 +898,6 @@ class LLMOrchestrator:
                 task_display = self.request_type or "未知任务"
 
                 # 可重试的HTTP错误
-                can_retry_with_compression = self._can_retry_with_compressed_images(
-                    active_request,
-                    original_response_request,
-                )
-
                 if e.status_code == 429 or e.status_code >= 500:
                     retry_remain -= 1
                     if retry_remain <= 0:
@@ -846,15 +912,22 @@ class LLMOrchestrator:
                     await asyncio.sleep(api_provider.retry_interval)
                     continue
 
-                # 特殊处理413，尝试压缩
-                data_uri_limit_bytes = self._extract_data_uri_limit_bytes(e)
-                if data_uri_limit_bytes is not None and can_retry_with_compression:
+                # 特殊处理413，尝试压缩；只有还能压缩重试时才需要解析错误文本
+                can_retry_with_compression = self._can_retry_with_compressed_images(
+                    active_request,
+                    original_response_request,
+                )
+                data_uri_limit_bytes = (
+                    self._extract_data_uri_limit_bytes(e) if can_retry_with_compression else None
+                )
+                if data_uri_limit_bytes is not None:
                     target_size = self._build_data_uri_retry_target_size(data_uri_limit_bytes)
                     logger.warning(
                         f"任务 '{task_display}' 的模型 '{model_info.name}' 返回 data URI 图片过大错误，"
                         f"检测到单项上限 {data_uri_limit_bytes} 字节，尝试压缩图片后重试..."
                     )
-                    compressed_messages = compress_messages(
+                    compressed_messages = await asyncio.to_thread(
+                        compress_messages,
                         active_request.message_list,
                         img_target_size=target_size,
                     )
@@ -865,8 +938,8 @@ class LLMOrchestrator:
                     logger.warning(
                         f"任务 '{task_display}' 的模型 '{model_info.name}' 返回413请求体过大，尝试压缩后重试..."
                     )
-                    # 压缩消息本身不消耗重试次数
-                    compressed_messages = compress_messages(active_request.message_list)
+                    # 压缩消息本身不消耗重试次数；图片压缩是 CPU 密集操作，放到线程中执行以免阻塞事件循环
+                    compressed_messages = await asyncio.to_thread(compress_messages, active_request.message_list)
                     active_request = active_request.copy_with(message_list=compressed_messages)
                     continue
 
@@ -971,9 +1044,14 @@ class LLMOrchestrator:
         Returns:
             LLMExecutionResult: 单次模型执行结果对象。
         """
+        # 每次请求只同步一次任务配置，各次模型尝试共用同一份配置
+        self._refresh_task_config()
         failed_models_this_request: Set[str] = set()
         max_attempts = 1 if str(model_name or "").strip() else len(self.model_for_task.model_list)
         last_exception: Optional[Exception] = None
+        # 消息工厂的签名在多次模型尝试之间不会变化，只解析一次
+        factory_parameter_count = len(inspect.signature(message_factory).parameters) if message_factory else 0
+        trace_request = self.request_type.startswith("maisaka.") and logger.isEnabledFor(logging.DEBUG)
 
         for _ in range(max_attempts):
             model_info, api_provider, client = self._select_model(
@@ -982,8 +1060,7 @@ class LLMOrchestrator:
             )
             message_list = []
             if message_factory:
-                parameter_count = len(inspect.signature(message_factory).parameters)
-                if parameter_count >= 2:
+                if factory_parameter_count >= 2:
                     message_result = message_factory(client, model_info)
                 else:
                     message_result = message_factory(client)
@@ -1006,7 +1083,7 @@ class LLMOrchestrator:
                     embedding_input=embedding_input,
                     audio_base64=audio_base64,
                 )
-                if self.request_type.startswith("maisaka."):
+                if trace_request:
                     logger.debug(
                         f"LLMOrchestrator[{self.request_type}] 正在向模型 model={model_info.name} 发送请求 "
                         f"(tool_options={len(tool_options or [])})"
@@ -1017,7 +1094,7 @@ class LLMOrchestrator:
                     request,
                     model_info.name,
                 )
-                if self.request_type.startswith("maisaka."):
+                if trace_request:
                     logger.debug(f"LLMOrchestrator[{self.request_type}] 模型 model={model_info.name} 已返回 API 响应")
                 total_tokens, penalty, usage_penalty = self.model_usage[model_info.name]
                 if response_usage := response.usage:
@@ -1028,7 +1105,7 @@ class LLMOrchestrator:
             except ReqAbortException as e:
                 total_tokens, penalty, usage_penalty = self.model_usage[model_info.name]
                 self.model_usage[model_info.name] = (total_tokens, penalty, usage_penalty - 1)
-                if self.request_type.startswith("maisaka."):
+                if trace_request:
                     logger.debug(
                         f"LLMOrchestrator[{self.request_type}] 模型 model={model_info.name} 的请求已被外部信号中断"
                     )
@@ -1071,10 +1148,12 @@ class LLMOrchestrator:
         Returns:
             Tuple[str, str]: `(正文内容, 推理内容)`。
         """
-        match = re.search(r"(?:<think>)?(.*?)</think>", content, re.DOTALL)
-        content = re.sub(r"(?:<think>)?.*?</think>", "", content, flags=re.DOTALL, count=1).strip()
-        reasoning = match[1].strip() if match else ""
-        return content, reasoning
+        if "</think>" not in content:
+            # 绝大多数非推理模型的输出不含思维链
+            return content.strip(), ""
+        # 只处理第一个 `</think>`：其之前（去掉可选的开头 `<think>`）为推理内容，之后为正文
+        reasoning, _, content = content.partition("</think>")
+        return content.strip(), reasoning.removeprefix("<think>").strip()
 
     @staticmethod
     def _get_original_error_info(e: Exception) -> str:
@@ -1099,10 +1178,18 @@ class LLMOrchestrator:
 
 
 class TempMethodsLLMUtils:
-    @staticmethod
-    def get_model_info_by_name(model_name: str) -> ModelInfo:
+    _model_info_index: Dict[str, ModelInfo] = {}
+    _model_info_index_source: List[ModelInfo] | None = None
+    _provider_index: Dict[str, APIProvider] = {}
+    _provider_index_source: List[APIProvider] | None = None
+
+    @classmethod
+    def get_model_info_by_name(cls, model_name: str) -> ModelInfo:
         """根据模型名称获取模型信息。
 
+        按名称建立的索引只在模型列表对象变化（即配置热重载）时重建，
+        每次请求选模型时不再线性扫描整个模型列表。
+
         Args:
             model_name: 模型名称
 
@@ -1112,13 +1199,19 @@ class TempMethodsLLMUtils:
         Raises:
             ValueError: 未找到指定模型。
         """
-        for model in config_manager.get_model_config().models:
-            if model.name == model_name:
-                return model
+        models = config_manager.get_model_config().models
+        if cls._model_info_index_source is not models:
+            model_info_index: Dict[str, ModelInfo] = {}
+            for model in models:
+                model_info_index.setdefault(model.name, model)
+            cls._model_info_index = model_info_index
+            cls._model_info_index_source = models
+        if (model := cls._model_info_index.get(model_name)) is not None:
+            return model
         raise ValueError(f"未找到名为 '{model_name}' 的模型")
 
-    @staticmethod
-    def get_provider_by_name(provider_name: str) -> APIProvider:
+    @classmethod
+    def get_provider_by_name(cls, provider_name: str) -> APIProvider:
         """根据提供商名称获取提供商信息。
 
         Args:
@@ -1130,9 +1223,15 @@ class TempMethodsLLMUtils:
         Raises:
             ValueError: 未找到指定提供商。
         """
-        for provider in config_manager.get_model_config().api_providers:
-            if provider.name == provider_name:
-                return provider
+        providers = config_manager.get_model_config().api_providers
+        if cls._provider_index_source is not providers:
+            provider_index: Dict[str, APIProvider] = {}
+            for provider in providers:
+                provider_index.setdefault(provider.name, provider)
+            cls._provider_index = provider_index
+            cls._provider_index_source = providers
+        if (provider := cls._provider_index.get(provider_name)) is not None:
+            return provider
         raise ValueError(f"未找到名为 '{provider_name}' 的API提供商")
 
 
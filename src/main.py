@@ -137,21 +137,26 @@ class MainSystem:
 
         emoji_load_task = asyncio.create_task(asyncio.to_thread(emoji_manager.load_emojis_from_db), name="emoji_load_from_db")
 
+        # 会话记录加载只读数据库，不依赖插件与记忆服务，与上述启动任务并行
+        from src.chat.message_receive.chat_manager import ChatSessionSaveTask, chat_manager
+
+        chat_load_task = asyncio.create_task(chat_manager.initialize(), name="chat_manager_load")
+
         # 启动API服务器
         # start_api_server()
         # logger.info("API服务器启动成功")
 
         try:
-            await asyncio.gather(plugin_runtime_task, a_memorix_task)
-            await emoji_load_task
+            await asyncio.gather(plugin_runtime_task, a_memorix_task, emoji_load_task, chat_load_task)
         except Exception:
-            for task in (plugin_runtime_task, a_memorix_task, emoji_load_task):
+            for task in (plugin_runtime_task, a_memorix_task, emoji_load_task, chat_load_task):
                 if not task.done():
                     task.cancel()
             await asyncio.gather(
                 plugin_runtime_task,
                 a_memorix_task,
                 emoji_load_task,
+                chat_load_task,
                 return_exceptions=True,
             )
             raise
@@ -160,11 +165,9 @@ class MainSystem:
         logger.info(t("startup.emoji_manager_initialized"))
 
         # 初始化聊天管理器
-        from src.chat.message_receive.chat_manager import chat_manager
         from src.services.memory_flow_service import memory_automation_service
 
-        await chat_manager.initialize()
-        asyncio.create_task(chat_manager.regularly_save_sessions())
+        await async_task_manager.add_task(ChatSessionSaveTask())
 
         logger.info(t("startup.chat_manager_initialized"))
         await memory_automation_service.start()
@@ -204,16 +207,17 @@ class MainSystem:
     async def schedule_tasks(self) -> None:
         """调度定时任务"""
         try:
-            from src.chat.image_system.image_cache_cleanup import periodic_image_cache_cleanup
+            from src.chat.image_system.image_cache_cleanup import ImageCacheCleanupTask
             from src.emoji_system.emoji_manager import emoji_manager
 
             self._register_message_handlers()
             if self.app is None or self.server is None:
                 raise RuntimeError("消息服务未初始化")
 
+            await async_task_manager.add_task(ImageCacheCleanupTask())
+
             tasks = [
                 emoji_manager.periodic_emoji_maintenance(),
-                periodic_image_cache_cleanup(),
                 self.app.run(),
                 self.server.run(),
             ]
@@ -236,6 +240,7 @@ async def main() -> None:
             await system.webui_server.shutdown()
         from src.A_memorix.host_service import a_memorix_host_service
         from src.emoji_system.emoji_manager import emoji_manager
+        from src.llm_models.utils import llm_usage_recorder
         from src.plugin_runtime.integration import get_plugin_runtime_manager
         from src.services.memory_flow_service import memory_automation_service
 
@@ -246,6 +251,8 @@ async def main() -> None:
         await get_plugin_runtime_manager().stop()
         await async_task_manager.stop_and_wait_all_tasks()
         await config_manager.stop_file_watcher()
+        # 所有任务停止后再写出剩余的模型使用记录，避免关闭过程中产生的记录留在缓冲区
+        await llm_usage_recorder.flush()
         set_main_loop(None)
 
 
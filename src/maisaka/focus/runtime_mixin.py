@@ -270,7 +270,7 @@ class MaisakaFocusRuntimeMixin:
                 continue
             if not focus_mode_manager.is_same_focus_scope(runtime.session_id, focus_session_id):
                 continue
-            if runtime._get_pending_message_count() > 0:
+            if runtime._has_pending_messages():
                 return runtime.session_id
         return ""
 
@@ -723,7 +723,8 @@ class MaisakaHeartFlowChatting(MaisakaFocusRuntimeMixin, MaisakaRuntimeDisplayMi
         优先记录 replyer 当次生成时实际收到的完整上下文列表；只有旧调用未传入时才回退到当前运行时历史。
         """
 
-        source_messages = list(context_messages) if context_messages is not None else list(self._chat_history)
+        # 只读遍历，无需复制整段上下文
+        source_messages = context_messages if context_messages is not None else self._chat_history
         snapshot: list[dict[str, Any]] = []
         excluded_segments = [segment.strip() for segment in (exclude_reply_segments or []) if segment.strip()]
         for message in source_messages:
@@ -754,14 +755,10 @@ class MaisakaHeartFlowChatting(MaisakaFocusRuntimeMixin, MaisakaRuntimeDisplayMi
 
     def _get_pending_message_count(self) -> int:
         """统计当前尚未进入内部循环的新消息数量。"""
-        pending_messages = self.message_cache[self._last_processed_index :]
-        if not pending_messages:
-            return 0
-
-        seen_message_ids: set[str] = set()
-        for message in pending_messages:
-            seen_message_ids.add(message.message_id)
-        return len(seen_message_ids)
+        # 专注调度每轮都会统计各会话的未读数，按下标遍历以免每次复制待处理区间
+        message_cache = self.message_cache
+        pending_range = range(self._last_processed_index, len(message_cache))
+        return len({message_cache[index].message_id for index in pending_range})
 
     def _prune_recent_external_message_intervals(self, now: Optional[float] = None) -> None:
         """仅保留最近 30 分钟内的外部消息间隔记录。"""
@@ -1611,6 +1608,7 @@ class MaisakaHeartFlowChatting(MaisakaFocusRuntimeMixin, MaisakaRuntimeDisplayMi
             return
 
         pending_context_count = len(context_messages)
+        now = time.time()
         if not self._should_trigger_learning(
             enabled=(
                 enable_expression_learning
@@ -1620,6 +1618,7 @@ class MaisakaHeartFlowChatting(MaisakaFocusRuntimeMixin, MaisakaRuntimeDisplayMi
             ),
             feature_name="表达/行为/黑话/高频词学习",
             last_extraction_time=self._last_expression_extraction_time,
+            now=now,
             pending_count=pending_context_count,
             min_messages_for_extraction=min(
                 self._expression_learner.min_messages_for_extraction,
@@ -1628,7 +1627,7 @@ class MaisakaHeartFlowChatting(MaisakaFocusRuntimeMixin, MaisakaRuntimeDisplayMi
         ):
             return
 
-        self._last_expression_extraction_time = time.time()
+        self._last_expression_extraction_time = now
         logger.info(
             f"{self.log_prefix} 触发裁切历史学习: "
             f"裁切上下文消息数量={pending_context_count} "
@@ -1691,6 +1690,7 @@ class MaisakaHeartFlowChatting(MaisakaFocusRuntimeMixin, MaisakaRuntimeDisplayMi
         enabled: bool,
         feature_name: str,
         last_extraction_time: float,
+        now: float,
         pending_count: int,
         min_messages_for_extraction: int,
     ) -> bool:
@@ -1700,7 +1700,7 @@ class MaisakaHeartFlowChatting(MaisakaFocusRuntimeMixin, MaisakaRuntimeDisplayMi
             logger.debug(f"{self.log_prefix} {feature_name}未启用，跳过本轮学习")
             return False
 
-        elapsed = time.time() - last_extraction_time
+        elapsed = now - last_extraction_time
         if elapsed < self._min_extraction_interval:
             logger.debug(
                 f"{self.log_prefix} {feature_name}触发间隔不足: "
@@ -22,6 +22,12 @@ class AsyncTask:
         self.run_interval: int = run_interval
         """多次运行的时间间隔（单位：秒，设为0则仅运行一次）"""
 
+    def get_run_interval(self) -> float:
+        """
+        获取下一次运行前的等待时间（单位：秒），子类可覆盖以按最新配置动态计算
+        """
+        return self.run_interval
+
     @abstractmethod
     async def run(self):
         """
@@ -36,8 +42,9 @@ class AsyncTask:
 
         while not abort_flag.is_set():
             await self.run()
-            if self.run_interval > 0:
-                await asyncio.sleep(self.run_interval)
+            run_interval = self.get_run_interval()
+            if run_interval > 0:
+                await asyncio.sleep(run_interval)
             else:
                 break
 
@@ -3,13 +3,14 @@
 当前实现基于两组 ``dict + heapq``：
 - ``_pending`` 和 ``_pending_expire_heap`` 负责管理待完成的出站记录
 - ``_receipts_by_external_id`` 和 ``_receipt_expire_heap`` 负责管理已完成回执索引
+- ``_pending_driver_ids`` 按内部消息 ID 索引待完成的驱动，未指定驱动时也无需扫描全部记录
 
 这样就不需要在每次读写时全表扫描过期项，而是通过懒清理逐步弹出已经过期
 或已经失效的堆节点。
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import heapq
 import time
@@ -94,6 +95,7 @@ class OutboundTracker:
         self._ttl_seconds = ttl_seconds
         self._pending: Dict[Tuple[str, str], PendingOutboundRecord] = {}
         self._pending_expire_heap: List[Tuple[float, str, str]] = []
+        self._pending_driver_ids: Dict[str, Set[str]] = {}
         self._receipts_by_external_id: Dict[str, StoredDeliveryReceipt] = {}
         self._receipt_expire_heap: List[Tuple[float, str]] = []
 
@@ -149,6 +151,7 @@ class OutboundTracker:
             metadata=metadata or {},
         )
         self._pending[pending_key] = record
+        self._pending_driver_ids.setdefault(internal_message_id, set()).add(driver_id)
         heapq.heappush(self._pending_expire_heap, (expires_at, internal_message_id, driver_id))
         return record
 
@@ -165,17 +168,9 @@ class OutboundTracker:
         self._cleanup_expired(now)
 
         pending_record: Optional[PendingOutboundRecord] = None
-        if receipt.driver_id:
-            pending_key = self._build_pending_key(receipt.internal_message_id, receipt.driver_id)
-            pending_record = self._pending.pop(pending_key, None)
-        else:
-            matched_records = [
-                key
-                for key, record in self._pending.items()
-                if record.internal_message_id == receipt.internal_message_id
-            ]
-            if len(matched_records) == 1:
-                pending_record = self._pending.pop(matched_records[0], None)
+        driver_id = receipt.driver_id or self._resolve_single_driver_id(receipt.internal_message_id)
+        if driver_id:
+            pending_record = self._pop_pending(self._build_pending_key(receipt.internal_message_id, driver_id))
 
         if receipt.external_message_id:
             expires_at = now + self._ttl_seconds
@@ -203,17 +198,10 @@ class OutboundTracker:
         """
         self._cleanup_expired(time.monotonic())
 
-        if driver_id:
-            return self._pending.get(self._build_pending_key(internal_message_id, driver_id))
-
-        matched_records = [
-            record
-            for record in self._pending.values()
-            if record.internal_message_id == internal_message_id
-        ]
-        if len(matched_records) == 1:
-            return matched_records[0]
-        return None
+        driver_id = driver_id or self._resolve_single_driver_id(internal_message_id)
+        if not driver_id:
+            return None
+        return self._pending.get(self._build_pending_key(internal_message_id, driver_id))
 
     def get_receipt_by_external_id(self, external_message_id: str) -> Optional[DeliveryReceipt]:
         """根据外部平台消息 ID 查询已完成回执。
@@ -232,9 +220,44 @@ class OutboundTracker:
         """清空全部待完成记录与已保存回执。"""
         self._pending.clear()
         self._pending_expire_heap.clear()
+        self._pending_driver_ids.clear()
         self._receipts_by_external_id.clear()
         self._receipt_expire_heap.clear()
 
+    def _resolve_single_driver_id(self, internal_message_id: str) -> Optional[str]:
+        """在未指定驱动时，查找内部消息 ID 唯一对应的待完成驱动。
+
+        Args:
+            internal_message_id: 内部消息 ID。
+
+        Returns:
+            Optional[str]: 仅有一个驱动存在待完成记录时返回该驱动 ID，否则返回 ``None``。
+        """
+        driver_ids = self._pending_driver_ids.get(internal_message_id)
+        if not driver_ids or len(driver_ids) != 1:
+            return None
+        return next(iter(driver_ids))
+
+    def _pop_pending(self, pending_key: Tuple[str, str]) -> Optional[PendingOutboundRecord]:
+        """移除一条待完成记录，并同步维护按内部消息 ID 建立的驱动索引。
+
+        Args:
+            pending_key: ``(internal_message_id, driver_id)`` 组合键。
+
+        Returns:
+            Optional[PendingOutboundRecord]: 若记录存在，则返回被移除的记录。
+        """
+        record = self._pending.pop(pending_key, None)
+        if record is None:
+            return None
+        internal_message_id, driver_id = pending_key
+        driver_ids = self._pending_driver_ids.get(internal_message_id)
+        if driver_ids is not None:
+            driver_ids.discard(driver_id)
+            if not driver_ids:
+                del self._pending_driver_ids[internal_message_id]
+        return record
+
     def _cleanup_expired(self, now: float) -> None:
         """清理内存中已经过期的待完成记录与已保存回执。
 
@@ -263,7 +286,7 @@ class OutboundTracker:
                 continue
             if current_record.expires_at != expires_at:
                 continue
-            self._pending.pop(pending_key, None)
+            self._pop_pending(pending_key)
 
     def _cleanup_expired_receipts(self, now: float) -> None:
         """清理已经过期的回执索引。
@@ -367,7 +367,7 @@ class PluginRunner:
         self._loader: PluginLoader = PluginLoader(host_version=os.getenv(ENV_HOST_VERSION, ""))
         self._loader.set_blocked_plugin_reasons(self._blocked_plugin_reasons)
         self._start_time: float = time.monotonic()
-        self._shutting_down: bool = False
+        self._shutdown_event: asyncio.Event = asyncio.Event()
         self._reload_lock: asyncio.Lock = asyncio.Lock()
         self._inflight_rpcs: Dict[int, InFlightRPC] = {}
 
@@ -439,8 +439,7 @@ class PluginRunner:
 
         # 5. 等待直到收到关停信号
         with contextlib.suppress(asyncio.CancelledError):
-            while not self._shutting_down:
-                await asyncio.sleep(1.0)
+            await self._shutdown_event.wait()
 
         # 6. 卸载 IPC 日志 Handler 并刷空剩余缓冲，然后断开连接
         logger.info("Runner 开始关停")
@@ -2112,6 +2111,10 @@ class PluginRunner:
         await self._dump_inflight_debug("prepare_shutdown")
         return envelope.make_response(payload={"acknowledged": True})
 
+    def _mark_shutting_down(self) -> None:
+        """标记 Runner 即将进入关停流程，并唤醒等待关停的主循环。"""
+        self._shutdown_event.set()
+
     async def _handle_shutdown(self, envelope: Envelope) -> Envelope:
         """处理关停 — 调用所有插件的 on_unload 后退出"""
         logger.info("收到 shutdown 信号，开始调用 on_unload")
@@ -2120,7 +2123,7 @@ class PluginRunner:
             meta = self._loader.get_plugin(plugin_id)
             if meta is not None:
                 await self._unload_plugin(meta, reason="runner_shutdown")
-        self._shutting_down = True
+        self._mark_shutting_down()
         return envelope.make_response(payload={"acknowledged": True})
 
     async def _handle_config_updated(self, envelope: Envelope) -> Envelope:
@@ -2352,11 +2355,7 @@ async def _async_main() -> None:
     )
 
     # 注册信号处理
-    def _mark_runner_shutting_down() -> None:
-        """标记 Runner 即将进入关停流程。"""
-        runner._shutting_down = True
-
-    _install_shutdown_signal_handlers(_mark_runner_shutting_down)
+    _install_shutdown_signal_handlers(runner._mark_shutting_down)
 
     await runner.run()
 
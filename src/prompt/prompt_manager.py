@@ -1,4 +1,5 @@
 from collections.abc import Callable, Coroutine
+from functools import lru_cache
 from pathlib import Path
 from string import Formatter
 from threading import RLock
@@ -26,6 +27,12 @@ CUSTOM_PROMPTS_DIR.mkdir(parents=True, exist_ok=True)
 SUFFIX_PROMPT = ".prompt"
 
 
+@lru_cache(maxsize=256)
+def _parse_template_fields(template: str) -> frozenset[str]:
+    """解析模板中的命名字段，模板内容不变时复用上次的解析结果"""
+    return frozenset(field_name for _, field_name, _, _ in Formatter().parse(template) if field_name)
+
+
 def _normalize_prompt_locale(locale: str | None = None) -> str:
     return normalize_locale(locale or get_locale())
 
@@ -111,8 +118,6 @@ class PromptManager:
         """存储 Prompt 实例，禁止直接从外部访问，否则将引起不可知后果"""
         self._context_construct_functions: dict[str, tuple[Callable[[str], str | Coroutine[Any, Any, str]], str]] = {}
         """存储上下文构造函数及其所属模块"""
-        self._formatter = Formatter()  # 仅用来解析模板
-        """模板解析器"""
         self._prompt_to_save: set[str] = set()
         """需要保存的 Prompt 名称集合"""
         self._prompt_save_locales: dict[str, str] = {}
@@ -248,7 +253,7 @@ class PromptManager:
         prompt.template = prompt.template.replace("{{", _LEFT_BRACE).replace("}}", _RIGHT_BRACE)
         if recursive_level > 10:
             raise RecursionError("递归层级过深，可能存在循环引用")
-        field_block = {field_name for _, field_name, _, _ in self._formatter.parse(prompt.template) if field_name}
+        field_block = _parse_template_fields(prompt.template)
         rendered_fields: dict[str, str] = {}
         for field_name in field_block:
             if field_name in self.prompts:
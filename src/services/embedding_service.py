@@ -66,6 +66,28 @@ class EmbeddingServiceClient:
         if not embedding_inputs:
             return []
 
+        # 相同文本只请求一次，结果再按原始顺序回填
+        unique_inputs = list(dict.fromkeys(embedding_inputs))
+        unique_results = await self._embed_unique_texts(unique_inputs, max_concurrent)
+        if len(unique_inputs) == len(embedding_inputs):
+            return unique_results
+        result_by_input = dict(zip(unique_inputs, unique_results, strict=True))
+        return [result_by_input[embedding_input] for embedding_input in embedding_inputs]
+
+    async def _embed_unique_texts(
+        self,
+        embedding_inputs: List[str],
+        max_concurrent: int | None,
+    ) -> List[EmbeddingResult]:
+        """按并发上限为已去重的文本生成嵌入向量。
+
+        Args:
+            embedding_inputs: 已去重的待编码文本列表。
+            max_concurrent: 最大并发数；未提供时按串行执行。
+
+        Returns:
+            List[EmbeddingResult]: 与输入顺序一致的嵌入结果列表。
+        """
         safe_max_concurrent = max(1, int(max_concurrent or 1))
         if safe_max_concurrent == 1:
             results: List[EmbeddingResult] = []
@@ -6,6 +6,7 @@
 
 from typing import Any, Dict, List, Tuple
 
+import asyncio
 import hashlib
 import inspect
 import json
@@ -187,6 +188,41 @@ class LLMServiceClient:
         self._record_cache_stats(result, prompt_text=prompt_text)
         return result
 
+    async def generate_responses(
+        self,
+        prompts: List[str],
+        options: LLMGenerationOptions | None = None,
+        max_concurrent: int | None = None,
+    ) -> List[LLMResponseResult]:
+        """并发生成多条互不依赖的单轮文本响应。
+
+        Args:
+            prompts: 文本提示词列表。
+            options: 所有提示词共用的文本生成选项。
+            max_concurrent: 最大并发数；未提供时全部提示词同时发起。
+
+        Returns:
+            List[LLMResponseResult]: 与输入顺序一致的文本生成结果列表。
+        """
+        if max_concurrent is None:
+            return list(await asyncio.gather(*(self.generate_response(prompt, options) for prompt in prompts)))
+
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrent)))
+
+        async def _generate_one(prompt: str) -> LLMResponseResult:
+            """在并发上限内生成单条响应。
+
+            Args:
+                prompt: 文本提示词。
+
+            Returns:
+                LLMResponseResult: 统一文本生成结果。
+            """
+            async with semaphore:
+                return await self.generate_response(prompt, options)
+
+        return list(await asyncio.gather(*(_generate_one(prompt) for prompt in prompts)))
+
     async def generate_response_with_messages(
         self,
         message_factory: MessageFactory,
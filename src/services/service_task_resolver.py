@@ -47,11 +47,17 @@ def resolve_task_name(task_name: str = "") -> str:
         RuntimeError: 当前没有任何可用模型配置时抛出。
         ValueError: 指定任务名不存在时抛出。
     """
+    normalized_task_name = task_name.strip()
+    if normalized_task_name and not normalized_task_name.startswith("__"):
+        # 指定任务名时直接按属性读取，命中即可返回，无需遍历整个任务配置对象
+        task_config = getattr(config_manager.get_model_config().model_task_config, normalized_task_name, None)
+        if isinstance(task_config, TaskConfig):
+            return normalized_task_name
+
     models = get_available_models()
     if not models:
         raise RuntimeError("没有可用的模型配置")
 
-    normalized_task_name = task_name.strip()
     if not normalized_task_name:
         return next(iter(models.keys()))
     if normalized_task_name not in models:
@@ -1,6 +1,7 @@
 """WebUI 聊天运行时服务。"""
 
 from dataclasses import dataclass
+import asyncio
 import base64
 import binascii
 import time
@@ -492,14 +493,22 @@ class ChatConnectionManager:
         except Exception as exc:
             logger.error(f"发送聊天消息失败: session={session_id}, error={exc}")
 
+    async def _send_to_sessions(self, session_ids: List[str], message: Dict[str, Any]) -> None:
+        """并发向多个逻辑会话发送同一条消息，单个连接较慢时不阻塞其他连接。
+
+        Args:
+            session_ids: 内部逻辑会话 ID 列表。
+            message: 待发送的消息内容。
+        """
+        await asyncio.gather(*(self.send_message(session_id, message) for session_id in session_ids))
+
     async def broadcast(self, message: Dict[str, Any]) -> None:
         """向全部逻辑聊天会话广播消息。
 
         Args:
             message: 待广播的消息内容。
         """
-        for session_id in list(self.active_connections.keys()):
-            await self.send_message(session_id, message)
+        await self._send_to_sessions(list(self.active_connections.keys()), message)
 
     async def broadcast_to_channel(self, channel_key: str, message: Dict[str, Any]) -> None:
         """向指定逻辑频道下的全部会话广播消息。
@@ -508,8 +517,7 @@ class ChatConnectionManager:
             channel_key: 频道键（``group:<gid>`` 或 ``private:<uid>``）。
             message: 待广播的消息内容。
         """
-        for session_id in list(self.group_sessions.get(channel_key, set())):
-            await self.send_message(session_id, message)
+        await self._send_to_sessions(list(self.group_sessions.get(channel_key, set())), message)
 
     async def broadcast_to_group(
         self,
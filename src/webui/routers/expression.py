@@ -1194,12 +1194,11 @@ async def clear_expressions(request: ExpressionClearRequest) -> ExpressionClearR
 
     try:
         chat_id = require_non_empty_chat_id(request.chat_id)
+        # 单条 DELETE 直接返回影响行数，无需先查询全部 ID
         with get_db_session() as session:
-            existing_ids = list(session.exec(select(Expression.id).where(col(Expression.session_id) == chat_id)).all())
-            if existing_ids:
-                session.exec(delete(Expression).where(col(Expression.session_id) == chat_id))
+            result = session.exec(delete(Expression).where(col(Expression.session_id) == chat_id))
+            deleted_count = result.rowcount or 0
 
-        deleted_count = len(existing_ids)
         logger.info(f"清除聊天流表达方式完成: chat_id={chat_id}, deleted={deleted_count}")
         return ExpressionClearResponse(message=f"成功清除 {deleted_count} 个表达方式", deleted_count=deleted_count)
 
@@ -1274,7 +1273,19 @@ async def import_legacy_expressions(request: LegacyExpressionImportRequest) -> L
         ignored_old_chat_ids: set[str] = set()
 
         with get_db_session() as session:
-            existing_pairs_by_chat: Dict[str, set[tuple[str, str]]] = {}
+            # 一次查询预载所有目标聊天流的已有表达方式，避免按聊天流逐个查询
+            existing_pairs_by_chat: Dict[str, set[tuple[str, str]]] = {
+                target_chat_id: set()
+                for target_chat_ids in mapping_by_old_chat_id.values()
+                for target_chat_id in target_chat_ids
+            }
+            for existing_chat_id, existing_situation, existing_style in session.exec(
+                select(Expression.session_id, Expression.situation, Expression.style).where(
+                    col(Expression.session_id).in_(list(existing_pairs_by_chat))
+                )
+            ).all():
+                existing_pairs_by_chat[existing_chat_id].add((existing_situation, existing_style))
+            new_expressions: List[Expression] = []
 
             for row in expression_rows:
                 old_chat_id = get_legacy_row_chat_id(row, expression_columns)
@@ -1298,16 +1309,6 @@ async def import_legacy_expressions(request: LegacyExpressionImportRequest) -> L
 
                 dedupe_key = (situation, style)
                 for target_chat_id in target_chat_ids:
-                    if target_chat_id not in existing_pairs_by_chat:
-                        existing_pairs_by_chat[target_chat_id] = {
-                            (existing_situation, existing_style)
-                            for existing_situation, existing_style in session.exec(
-                                select(Expression.situation, Expression.style).where(
-                                    col(Expression.session_id) == target_chat_id
-                                )
-                            ).all()
-                        }
-
                     if dedupe_key in existing_pairs_by_chat[target_chat_id]:
                         skipped_count += 1
                         continue
@@ -1331,10 +1332,12 @@ async def import_legacy_expressions(request: LegacyExpressionImportRequest) -> L
                             str(row["modified_by"]) if "modified_by" in expression_columns and row["modified_by"] else None
                         ),
                     )
-                    session.add(expression)
+                    new_expressions.append(expression)
                     existing_pairs_by_chat[target_chat_id].add(dedupe_key)
                     imported_count += 1
 
+            session.add_all(new_expressions)
+
         message = (
             f"旧版导入完成：成功 {imported_count} 个，跳过 {skipped_count} 个，"
             f"失败 {failed_count} 个，未导入分组 {len(ignored_old_chat_ids)} 个"
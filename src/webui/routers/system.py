@@ -1367,6 +1367,14 @@ async def _stop_runtime_before_restart() -> None:
     except Exception as exc:
         logger.warning(f"WebUI 重启前停止异步任务失败: {exc}")
 
+    # 所有任务停止后再写出剩余的模型使用记录，避免关闭过程中产生的记录留在缓冲区
+    try:
+        from src.llm_models.utils import llm_usage_recorder
+
+        await llm_usage_recorder.flush()
+    except Exception as exc:
+        logger.warning(f"WebUI 重启前写出模型使用记录失败: {exc}")
+
 
 async def _delayed_restart() -> None:
     await asyncio.sleep(0.5)  # 延迟 0.5 秒，确保响应已发送